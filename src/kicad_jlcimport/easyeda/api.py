@@ -469,9 +469,12 @@ def _strip_cjk_parens(text: str) -> str:
     return re.sub(r"\([^\x00-\x7F]+\)", "", text).strip()
 
 
-def fetch_full_component(lcsc_id: str) -> Dict[str, Any]:
+def fetch_full_component(lcsc_id: str, uuids: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     """High-level: fetch all data needed for a component.
 
+    ``uuids`` may be passed when the caller already has the result of
+    ``fetch_component_uuids`` for this part, to avoid fetching it twice.
+
     Returns dict with keys:
         title, prefix, lcsc_id, datasheet,
         symbol_uuids, footprint_uuid,
@@ -480,7 +483,8 @@ def fetch_full_component(lcsc_id: str) -> Dict[str, Any]:
         description, manufacturer, manufacturer_part
     """
     lcsc_id = validate_lcsc_id(lcsc_id)
-    uuids = fetch_component_uuids(lcsc_id)
+    if uuids is None:
+        uuids = fetch_component_uuids(lcsc_id)
 
     # Last UUID is footprint, others are symbol parts
     footprint_uuid = uuids[-1]["component_uuid"]
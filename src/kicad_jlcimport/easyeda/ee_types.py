@@ -1,10 +1,15 @@
 """Dataclass types for parsed EasyEDA primitives."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+# Parsers create one instance per shape, so drop the per-instance __dict__
+# where supported (dataclass(slots=True) needs Python 3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class EEPad:
     shape: str  # "RECT", "OVAL", "ELLIPSE", "POLYGON"
     x: float
@@ -19,14 +24,14 @@ class EEPad:
     slot_length: float = 0.0  # oval slot drill length in mm (0 for circular)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EETrack:
     width: float
     layer: str
     points: List[Tuple[float, float]]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EEArc:
     width: float
     layer: str
@@ -38,7 +43,7 @@ class EEArc:
     sweep: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EECircle:
     cx: float
     cy: float
@@ -49,7 +54,7 @@ class EECircle:
     filled: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EERectangle:
     x: float
     y: float
@@ -59,21 +64,21 @@ class EERectangle:
     corner_radius: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EEHole:
     x: float
     y: float
     radius: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EESolidRegion:
     layer: str
     points: List[Tuple[float, float]]
     region_type: str  # "npth", "solid", "cutout"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EE3DModel:
     uuid: str
     origin_x: float
@@ -82,7 +87,7 @@ class EE3DModel:
     rotation: Tuple[float, float, float]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EEPin:
     number: str
     name: str
@@ -95,7 +100,7 @@ class EEPin:
     number_visible: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EEPolyline:
     points: List[Tuple[float, float]]
     stroke_width: float = 0.0
@@ -103,7 +108,7 @@ class EEPolyline:
     fill: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EEText:
     text: str
     x: float
@@ -112,7 +117,7 @@ class EEText:
     font_size: float = 1.27  # mm
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EESymbol:
     rectangles: List[EERectangle] = field(default_factory=list)
     circles: List[EECircle] = field(default_factory=list)
@@ -122,7 +127,7 @@ class EESymbol:
     texts: List[EEText] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EEFootprint:
     pads: List[EEPad] = field(default_factory=list)
     tracks: List[EETrack] = field(default_factory=list)
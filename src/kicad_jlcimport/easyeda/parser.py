@@ -48,20 +48,45 @@ PIN_TYPES = {
 
 _SOLID_REGION_LAYERS = {"3", "4", "12"}
 
+# Circles on these layers are decorative and never imported:
+# - Layer 100: Lead shape layer (decorative pad circles)
+# - Layer 101: Component Marking Layer (small annotation markers)
+_SKIPPED_CIRCLE_LAYERS = frozenset(("100", "101"))
+
 
 MILS_TO_MM_DIVISOR = 3.937
+_MILS_TO_MM_FACTOR = 1.0 / MILS_TO_MM_DIVISOR
 
 
 def mil_to_mm(mil: float) -> float:
     """Convert mils to millimeters."""
-    return mil / MILS_TO_MM_DIVISOR
+    return mil * _MILS_TO_MM_FACTOR
 
 
 _SVG_ARC_RE = re.compile(
     r"M\s*([\d.e+-]+)[,\s]+([\d.e+-]+)\s*A\s*([\d.e+-]+)[,\s]+([\d.e+-]+)"
-    r"[,\s]+([\d.e+-]+)[,\s]+([01])[,\s]+([01])[,\s]+([\d.e+-]+)[,\s]+([\d.e+-]+)"
+    r"[,\s]+([\d.e+-]+)[,\s]+([01])[,\s]+([01])[,\s]+([\d.e+-]+)[,\s]+([\d.e+-]+)",
+    re.ASCII,
+)
+
+# SVG path tokenizers shared by the polygon, text and symbol path parsers
+_SVG_POINT_RE = re.compile(r"(?:^|[ML])\s*([^\s,ML]+)[,\s]+([^\s,ML]+)", re.ASCII)
+_COMMA_TO_SPACE = str.maketrans(",", " ")
+_SVG_MOVE_RE = re.compile(r"M\s*([\d.e+-]+)\s+([\d.e+-]+)", re.ASCII)
+_SVG_ARC_CMD_RE = re.compile(
+    r"A\s*([\d.e+-]+)\s+([\d.e+-]+)\s+([\d.e+-]+)\s+([01])\s+([01])\s+([\d.e+-]+)\s+([\d.e+-]+)",
+    re.ASCII,
 )
 
+# Pin path section: "M360,290h10", "M 440 310 h -10", "M400,300v10"
+_PIN_PATH_MOVE_RE = re.compile(r"M\s*([-\d.]+)[,\s]+([-\d.]+)", re.ASCII)
+_PIN_PATH_H_RE = re.compile(r"h\s*([-\d.]+)", re.ASCII)
+_PIN_PATH_V_RE = re.compile(r"v\s*([-\d.]+)", re.ASCII)
+
+# KiCad pin rotation for a (step axis, step is positive) pin path that
+# starts at the pin connection point
+_PIN_STEP_DIRECTION = {("h", True): 0, ("h", False): 180, ("v", True): 270, ("v", False): 90}
+
 
 def _parse_svg_arc_path(svg_path: str):
     """Parse an SVG arc path string (M sx sy A rx ry rot large sweep ex ey).
@@ -86,10 +111,11 @@ def _parse_svg_arc_path(svg_path: str):
 
 def _find_svg_path(parts: List[str], start: int = 1) -> str:
     """Find the SVG path field (starting with 'M') in a parts list."""
-    for i in range(start, len(parts)):
-        p = parts[i].strip()
-        if p.startswith("M"):
-            return p
+    for p in parts[start:]:
+        # lstrip() returns the field itself when there is no leading whitespace;
+        # only the matching field needs fully stripping
+        if p.lstrip().startswith("M"):
+            return p.strip()
     return ""
 
 
@@ -99,44 +125,17 @@ def parse_footprint_shapes(shapes: List[str], origin_x: float, origin_y: float)
 
     for shape_str in shapes:
         parts = shape_str.split("~")
-        shape_type = parts[0]
-
-        if shape_type == "PAD":
-            pad = _parse_pad(parts)
-            if pad:
-                fp.pads.append(pad)
-        elif shape_type == "TRACK":
-            track = _parse_track(parts)
-            if track:
-                fp.tracks.append(track)
-        elif shape_type == "ARC":
-            arc = _parse_fp_arc(parts)
-            if arc:
-                fp.arcs.append(arc)
-        elif shape_type == "CIRCLE":
-            circle = _parse_circle(parts)
-            if circle:
-                fp.circles.append(circle)
-        elif shape_type == "HOLE":
-            hole = _parse_hole(parts)
-            if hole:
-                fp.holes.append(hole)
-        elif shape_type == "SOLIDREGION":
-            region = _parse_solid_region(parts)
-            if region:
-                fp.regions.append(region)
-        elif shape_type == "SVGNODE":
-            model = _parse_svgnode(parts)
-            if model:
-                fp.model = model
-        elif shape_type == "TEXT":
-            tracks = _parse_fp_text(parts)
-            if tracks:
-                fp.tracks.extend(tracks)
-        elif shape_type == "RECT":
-            track = _parse_rect_as_tracks(parts)
-            if track:
-                fp.tracks.extend(track)
+        entry = _FOOTPRINT_SHAPE_PARSERS.get(parts[0])
+        if entry is None:
+            continue
+        parse, attr, add = entry
+        result = parse(parts)
+        if not result:
+            continue
+        if add is None:
+            setattr(fp, attr, result)
+        else:
+            add(getattr(fp, attr), result)
 
     # Apply origin offset to all coordinates
     ox = mil_to_mm(origin_x)
@@ -167,40 +166,17 @@ def parse_symbol_shapes(shapes: List[str], origin_x: float, origin_y: float) ->
     sym = EESymbol()
 
     for shape_str in shapes:
-        # Symbols use ^^ as sub-delimiter within pin shapes
-        if shape_str.startswith("P~"):
-            pin = _parse_pin(shape_str, origin_x, origin_y)
-            if pin:
-                sym.pins.append(pin)
-        elif shape_str.startswith("R~"):
-            rect = _parse_sym_rect(shape_str, origin_x, origin_y)
-            if rect:
-                sym.rectangles.append(rect)
-        elif shape_str.startswith("E~"):
-            circle = _parse_sym_circle(shape_str, origin_x, origin_y)
-            if circle:
-                sym.circles.append(circle)
-        elif shape_str.startswith("PL~") or shape_str.startswith("PG~"):
-            poly = _parse_sym_polyline(shape_str, origin_x, origin_y)
-            if poly:
-                sym.polylines.append(poly)
-        elif shape_str.startswith("A~"):
-            arc = _parse_sym_arc(shape_str, origin_x, origin_y)
-            if arc:
-                sym.arcs.append(arc)
-        elif shape_str.startswith("PT~"):
-            path = _parse_sym_path(shape_str, origin_x, origin_y)
-            if path:
-                sym.polylines.append(path)
-        elif shape_str.startswith("C~"):
-            # C~ is circle (different from E~ ellipse in some versions)
-            circle = _parse_sym_circle_c(shape_str, origin_x, origin_y)
-            if circle:
-                sym.circles.append(circle)
-        elif shape_str.startswith("T~"):
-            text = _parse_sym_text(shape_str, origin_x, origin_y)
-            if text:
-                sym.texts.append(text)
+        end = shape_str.find("~")
+        if end < 0:
+            continue
+        shape_type = shape_str[:end]
+        entry = _SYMBOL_SHAPE_PARSERS.get(shape_type)
+        if entry is None:
+            continue
+        parse, attr = entry
+        result = parse(shape_str, origin_x, origin_y)
+        if result:
+            getattr(sym, attr).append(result)
 
     return sym
 
@@ -210,24 +186,23 @@ def parse_symbol_shapes(shapes: List[str], origin_x: float, origin_y: float) ->
 
 def _parse_pad(parts: List[str]) -> EEPad:
     """Parse PAD shape string."""
-    # PAD~shape~x~y~sx~sy~layer~<empty>~number~drill~polygon_nodes~rotation~id~...
-    shape = parts[1]
-    x = float(parts[2])
-    y = float(parts[3])
-    sx = float(parts[4])
-    sy = float(parts[5])
-    layer = parts[6]
-    # parts[7] is empty (net field)
-    number = parts[8] if len(parts) > 8 else ""
-    drill = float(parts[9]) if len(parts) > 9 and parts[9] else 0.0
-
-    # parts[10] = polygon_nodes (space-separated coords, empty for ELLIPSE)
-    # parts[11] = rotation
-    # parts[13] = slot length (oval drill slot, in mils — full length, not radius)
-    polygon_str = parts[10] if len(parts) > 10 else ""
-    rotation = float(parts[11]) if len(parts) > 11 and parts[11] else 0.0
+    # PAD~shape~x~y~sx~sy~layer~<empty>~number~drill~polygon_nodes~rotation~id~slot_length~...
+    # - net (parts[7]) is empty
+    # - polygon_nodes: space-separated coords, empty for ELLIPSE
+    # - slot_length: oval drill slot, in mils — full length, not radius
+    # Trailing optional fields may be missing; they read as empty strings.
+    fields = parts[1:14]
+    if len(fields) < 13:
+        fields += [""] * (13 - len(fields))
+    shape, x, y, sx, sy, layer, _net, number, drill, polygon_str, rotation, _id, slot_length = fields
+    x = float(x)
+    y = float(y)
+    sx = float(sx)
+    sy = float(sy)
+    drill = float(drill) if drill else 0.0
+    rotation = float(rotation) if rotation else 0.0
     try:
-        slot_length_mil = float(parts[13]) if len(parts) > 13 and parts[13] else 0.0
+        slot_length_mil = float(slot_length) if slot_length else 0.0
     except ValueError:
         slot_length_mil = 0.0
 
@@ -238,9 +213,10 @@ def _parse_pad(parts: List[str]) -> EEPad:
         except ValueError:
             return None  # Reject pad with invalid polygon coordinates
         # Store as pad-center-relative coordinates in mm (pairs of x, y)
+        f = _MILS_TO_MM_FACTOR
         for i in range(0, len(coords) - 1, 2):
-            poly_points.append(mil_to_mm(coords[i] - x))
-            poly_points.append(mil_to_mm(coords[i + 1] - y))
+            poly_points.append((coords[i] - x) * f)
+            poly_points.append((coords[i + 1] - y) * f)
 
     return EEPad(
         shape=shape,
@@ -265,9 +241,9 @@ def _parse_track(parts: List[str]) -> EETrack:
 
     # Find the points field - may be at index 3 or 4
     points_str = ""
-    for i in range(3, len(parts)):
-        if " " in parts[i] and any(c.isdigit() for c in parts[i]):
-            points_str = parts[i]
+    for p in parts[3:]:
+        if " " in p and any(map(str.isdigit, p)):
+            points_str = p
             break
 
     if not points_str:
@@ -275,11 +251,10 @@ def _parse_track(parts: List[str]) -> EETrack:
 
     coords = points_str.strip().split(" ")
     points = []
+    f = _MILS_TO_MM_FACTOR
     for i in range(0, len(coords) - 1, 2):
         try:
-            px = mil_to_mm(float(coords[i]))
-            py = mil_to_mm(float(coords[i + 1]))
-            points.append((px, py))
+            points.append((float(coords[i]) * f, float(coords[i + 1]) * f))
         except (ValueError, IndexError):
             continue
 
@@ -322,20 +297,18 @@ def _parse_fp_arc(parts: List[str]) -> EEArc:
 def _parse_circle(parts: List[str]) -> EECircle:
     """Parse CIRCLE shape string."""
     # CIRCLE~cx~cy~radius~width~layer~id~flag~...
+    layer = parts[5]
+    # Skip decorative/annotation circles before converting any fields
+    if layer in _SKIPPED_CIRCLE_LAYERS:
+        return None
+
     cx = float(parts[1])
     cy = float(parts[2])
     radius = float(parts[3])
     width = float(parts[4])
-    layer = parts[5]
     # Flag at position 7 - "0" may indicate auxiliary/interior circles
     flag = parts[7] if len(parts) > 7 else ""
 
-    # Skip decorative/annotation circles:
-    # - Layer 100: Lead shape layer (decorative pad circles)
-    # - Layer 101: Component Marking Layer (small annotation markers)
-    if layer in ("100", "101"):
-        return None
-
     kicad_layer = LAYER_MAP.get(layer, "F.SilkS")
     # When stroke width >= 2*radius the stroke covers the entire circle,
     # which is how EasyEDA represents a solid filled circle.
@@ -403,29 +376,29 @@ def _parse_solid_region(parts: List[str]) -> EESolidRegion:
     return None
 
 
-def _parse_svg_polygon(svg_path: str) -> List[Tuple[float, float]]:
-    """Parse SVG path with M and L commands into point list."""
+def _scan_svg_points(svg_path: str) -> List[Tuple[float, float]]:
+    """Scan an SVG path with M, L and Z commands into raw (x, y) mil pairs.
+
+    Each M/L command contributes its first coordinate pair, separated by
+    whitespace and/or commas. Pairs that are not valid numbers are skipped.
+    """
     points = []
-    # Remove Z at end
-    path = svg_path.replace("Z", "").replace("z", "").strip()
-    # Split on M and L commands
-    tokens = re.split(r"[ML]\s*", path)
-    for token in tokens:
-        token = token.strip()
-        if not token:
+    # Close-path commands carry no coordinates
+    path = svg_path.replace("Z", "").replace("z", "")
+    for sx, sy in _SVG_POINT_RE.findall(path):
+        try:
+            points.append((float(sx), float(sy)))
+        except ValueError:
             continue
-        # Split on whitespace or commas
-        coords = re.split(r"[,\s]+", token)
-        if len(coords) >= 2:
-            try:
-                x = mil_to_mm(float(coords[0]))
-                y = mil_to_mm(float(coords[1]))
-                points.append((x, y))
-            except ValueError:
-                continue
     return points
 
 
+def _parse_svg_polygon(svg_path: str) -> List[Tuple[float, float]]:
+    """Parse SVG path with M and L commands into point list."""
+    f = _MILS_TO_MM_FACTOR
+    return [(x * f, y * f) for x, y in _scan_svg_points(svg_path)]
+
+
 def _parse_svg_path_with_arcs(svg_path: str) -> List[Tuple[float, float]]:
     """Parse SVG path containing arc commands, approximating arcs as polygons.
 
@@ -437,7 +410,7 @@ def _parse_svg_path_with_arcs(svg_path: str) -> List[Tuple[float, float]]:
     path = svg_path.replace("Z", "").replace("z", "").strip()
 
     # Extract starting point from M command
-    m_match = re.match(r"M\s*([\d.e+-]+)\s+([\d.e+-]+)", path)
+    m_match = _SVG_MOVE_RE.match(path)
     if not m_match:
         return []
 
@@ -445,8 +418,7 @@ def _parse_svg_path_with_arcs(svg_path: str) -> List[Tuple[float, float]]:
     start_y = float(m_match.group(2))
 
     # Find all arc commands
-    arc_pattern = r"A\s*([\d.e+-]+)\s+([\d.e+-]+)\s+([\d.e+-]+)\s+([01])\s+([01])\s+([\d.e+-]+)\s+([\d.e+-]+)"
-    arcs = re.findall(arc_pattern, path)
+    arcs = _SVG_ARC_CMD_RE.findall(path)
 
     if not arcs:
         return []
@@ -465,11 +437,12 @@ def _parse_svg_path_with_arcs(svg_path: str) -> List[Tuple[float, float]]:
 
     # Generate polygon approximation of circle (16 segments)
     num_segments = 16
+    f = _MILS_TO_MM_FACTOR
     for i in range(num_segments):
         angle = 2 * math.pi * i / num_segments
         px = cx + radius * math.cos(angle)
         py = cy + radius * math.sin(angle)
-        points.append((mil_to_mm(px), mil_to_mm(py)))
+        points.append((px * f, py * f))
 
     return points
 
@@ -547,27 +520,22 @@ def _parse_fp_text(parts: List[str]) -> List[EETrack]:
     kicad_layer = LAYER_MAP[layer]
     w = mil_to_mm(width) if width > 0 else 0.1
 
+    # Commas and whitespace both separate coordinates; normalize them once so
+    # plain str.split() tokenizes every coordinate pair
+    path = svg_path.translate(_COMMA_TO_SPACE)
+    f = _MILS_TO_MM_FACTOR
+
     # Split SVG path on M commands to get individual sub-paths
     # Each sub-path is M x y L x y [L x y ...]
     tracks = []
-    segments = re.split(r"M\s*", svg_path.strip())
-    for seg in segments:
-        seg = seg.strip()
-        if not seg:
-            continue
+    for seg in path.split("M"):
         # Parse all coordinates (M start + L continuations)
-        tokens = re.split(r"L\s*", seg)
         points = []
-        for token in tokens:
-            token = token.strip()
-            if not token:
-                continue
-            coords = re.split(r"[,\s]+", token)
+        for token in seg.split("L"):
+            coords = token.split()
             if len(coords) >= 2:
                 try:
-                    px = mil_to_mm(float(coords[0]))
-                    py = mil_to_mm(float(coords[1]))
-                    points.append((px, py))
+                    points.append((float(coords[0]) * f, float(coords[1]) * f))
                 except ValueError:
                     continue
         if len(points) >= 2:
@@ -576,15 +544,47 @@ def _parse_fp_text(parts: List[str]) -> List[EETrack]:
     return tracks
 
 
+# Shape type -> (parser, EEFootprint attribute, how the result is added).
+# TEXT and RECT yield track lists; a None adder assigns, so the last model wins.
+_FOOTPRINT_SHAPE_PARSERS = {
+    "PAD": (_parse_pad, "pads", list.append),
+    "TRACK": (_parse_track, "tracks", list.append),
+    "ARC": (_parse_fp_arc, "arcs", list.append),
+    "CIRCLE": (_parse_circle, "circles", list.append),
+    "HOLE": (_parse_hole, "holes", list.append),
+    "SOLIDREGION": (_parse_solid_region, "regions", list.append),
+    "SVGNODE": (_parse_svgnode, "model", None),
+    "TEXT": (_parse_fp_text, "tracks", list.extend),
+    "RECT": (_parse_rect_as_tracks, "tracks", list.extend),
+}
+
+
 # --- Symbol shape parsers ---
 
 
+def _scan_pin_path(path_section: str):
+    """Extract the start point and first h/v step of a pin's SVG path section.
+
+    Returns ((mx, my) or None, "h"/"v" or None, step). A horizontal step takes
+    precedence over a vertical one.
+    """
+    m_match = _PIN_PATH_MOVE_RE.match(path_section)
+    start = (float(m_match.group(1)), float(m_match.group(2))) if m_match else None
+    h_match = _PIN_PATH_H_RE.search(path_section)
+    if h_match:
+        return start, "h", float(h_match.group(1))
+    v_match = _PIN_PATH_V_RE.search(path_section)
+    if v_match:
+        return start, "v", float(v_match.group(1))
+    return start, None, 0.0
+
+
 def _parse_pin(shape_str: str, origin_x: float, origin_y: float) -> EEPin:
     """Parse pin shape string."""
-    # Split on ^^ first to get sub-parts
-    sections = shape_str.split("^^")
+    # Split on ^^ first to get sub-parts (only the first five are used)
+    sections = shape_str.split("^^", 5)
     # First section has the main pin data
-    main_parts = sections[0].split("~")
+    main_parts = sections[0].split("~", 7)
 
     # P~show~elec_type~spice_index~x~y~rotation~id~...
     # Note: main_parts[3] is the SPICE pin index, not the display number.
@@ -609,44 +609,27 @@ def _parse_pin(shape_str: str, origin_x: float, origin_y: float) -> EEPin:
     length = 10.0  # default
     path_direction = None  # Will be 0, 90, 180, or 270
     if len(sections) > 2:
-        path_section = sections[2]
-        # Path is like "M360,290h10" or "M 440 310 h -10" or "M400,300v10"
-        m_match = re.match(r"M\s*([-\d.]+)[,\s]+([-\d.]+)", path_section)
-        h_match = re.search(r"h\s*([-\d.]+)", path_section)
-        v_match = re.search(r"v\s*([-\d.]+)", path_section)
+        start, axis, val = _scan_pin_path(sections[2])
         # Check whether path M start matches the pin position (both axes).
         # Default True so we preserve original behaviour when M is unparseable.
         starts_at_pin = True
-        if m_match:
-            mx = float(m_match.group(1))
-            my = float(m_match.group(2))
-            starts_at_pin = abs(mx - x) < 0.5 and abs(my - y) < 0.5
+        if start:
+            starts_at_pin = abs(start[0] - x) < 0.5 and abs(start[1] - y) < 0.5
 
-        if h_match:
-            val = float(h_match.group(1))
-            length = abs(val)
-            if starts_at_pin:
-                # Path goes from pin connection point toward body
-                path_direction = 0 if val > 0 else 180
-            else:
-                # Path goes from body toward pin — flip direction
-                path_direction = 180 if val > 0 else 0
-        elif v_match:
-            val = float(v_match.group(1))
+        if axis:
             length = abs(val)
-            if starts_at_pin:
-                # Path goes from pin connection point toward body
-                path_direction = 270 if val > 0 else 90
-            else:
+            # Direction for a path going from pin connection point toward body
+            path_direction = _PIN_STEP_DIRECTION[axis, val > 0]
+            if not starts_at_pin:
                 # Path goes from body toward pin — flip direction
-                path_direction = 90 if val > 0 else 270
+                path_direction = (path_direction + 180) % 360
 
     # Parse pin name from section 3 (name display)
     # Format: visible~x~y~rotation~text~alignment~...~color
     name = ""
     name_visible = True
     if len(sections) > 3:
-        name_parts = sections[3].split("~")
+        name_parts = sections[3].split("~", 5)
         # Text is at index 4
         if len(name_parts) > 4:
             name = name_parts[4]
@@ -658,7 +641,7 @@ def _parse_pin(shape_str: str, origin_x: float, origin_y: float) -> EEPin:
     # Format: visible~x~y~rotation~number_text~alignment~...~color
     number_visible = True
     if len(sections) > 4:
-        num_parts = sections[4].split("~")
+        num_parts = sections[4].split("~", 5)
         if num_parts and num_parts[0] == "0":
             number_visible = False
         if len(num_parts) > 4 and num_parts[4]:
@@ -691,7 +674,7 @@ def _parse_pin(shape_str: str, origin_x: float, origin_y: float) -> EEPin:
 
 def _parse_sym_rect(shape_str: str, origin_x: float, origin_y: float) -> EERectangle:
     """Parse symbol rectangle."""
-    parts = shape_str.split("~")
+    parts = shape_str.split("~", 12)
     # R~x~y~[rx]~[ry]~width~height~... (12+ fields)
     # or R~x~y~width~height~... (shorter)
     try:
@@ -719,7 +702,7 @@ def _parse_sym_rect(shape_str: str, origin_x: float, origin_y: float) -> EERecta
 
 def _parse_sym_circle(shape_str: str, origin_x: float, origin_y: float) -> EECircle:
     """Parse symbol circle/ellipse."""
-    parts = shape_str.split("~")
+    parts = shape_str.split("~", 9)
     # E~cx~cy~rx~ry~stroke_color~stroke_width~?~fill_color~id~...
     try:
         cx = float(parts[1])
@@ -754,6 +737,7 @@ def _parse_sym_polyline(shape_str: str, origin_x: float, origin_y: float) -> EEP
     # Format 1 (space-separated in one field): PL~13 -8 13 8~#880000~...
     # Format 2 (tilde-separated): PL~100~100~200~200~0~3
     points = []
+    f = _MILS_TO_MM_FACTOR
 
     # Check if coordinates are space-separated in a single field
     if len(parts) > 1 and " " in parts[1]:
@@ -763,7 +747,7 @@ def _parse_sym_polyline(shape_str: str, origin_x: float, origin_y: float) -> EEP
             try:
                 x = float(coords[i])
                 y = float(coords[i + 1])
-                points.append((mil_to_mm(x - origin_x), -mil_to_mm(y - origin_y)))
+                points.append(((x - origin_x) * f, -((y - origin_y) * f)))
                 i += 2
             except (ValueError, IndexError):
                 break
@@ -774,7 +758,7 @@ def _parse_sym_polyline(shape_str: str, origin_x: float, origin_y: float) -> EEP
             try:
                 x = float(parts[i])
                 y = float(parts[i + 1])
-                points.append((mil_to_mm(x - origin_x), -mil_to_mm(y - origin_y)))
+                points.append(((x - origin_x) * f, -((y - origin_y) * f)))
                 i += 2
             except (ValueError, IndexError):
                 break
@@ -791,7 +775,7 @@ def _parse_sym_path(shape_str: str, origin_x: float, origin_y: float) -> EEPolyl
     Format: PT~<svg_path>~<stroke_color>~<stroke_width>~<stroke_style>~<fill_color>~<id>~...
     Example: PT~M 414 279 L 412 275 L 410 279 Z ~#880000~1~0~#880000~gge44~0~
     """
-    parts = shape_str.split("~")
+    parts = shape_str.split("~", 6)
     if len(parts) < 2:
         return None
 
@@ -799,24 +783,10 @@ def _parse_sym_path(shape_str: str, origin_x: float, origin_y: float) -> EEPolyl
     if not svg_path:
         return None
 
-    # Parse SVG path manually to apply origin offset correctly
-    # (can't use _parse_svg_polygon directly as it converts to mm before we apply offset)
-    points = []
-    path = svg_path.replace("Z", "").replace("z", "").strip()
-    tokens = re.split(r"[ML]\s*", path)
-    for token in tokens:
-        token = token.strip()
-        if not token:
-            continue
-        # Split on whitespace or commas for consistency with _parse_svg_polygon
-        coords = re.split(r"[,\s]+", token)
-        if len(coords) >= 2:
-            try:
-                x = float(coords[0])
-                y = float(coords[1])
-                points.append((mil_to_mm(x - origin_x), -mil_to_mm(y - origin_y)))
-            except ValueError:
-                continue
+    # Scan raw mil coordinates so the origin offset is applied before converting
+    # (_parse_svg_polygon converts to mm first)
+    f = _MILS_TO_MM_FACTOR
+    points = [((x - origin_x) * f, -((y - origin_y) * f)) for x, y in _scan_svg_points(svg_path)]
 
     if len(points) < 2:
         return None
@@ -838,7 +808,7 @@ def _parse_sym_circle_c(shape_str: str, origin_x: float, origin_y: float) -> EEC
 
     Format: C~cx~cy~radius~stroke_color~stroke_width~fill_color~id~...
     """
-    parts = shape_str.split("~")
+    parts = shape_str.split("~", 7)
     try:
         cx = float(parts[1])
         cy = float(parts[2])
@@ -869,7 +839,7 @@ def _parse_sym_text(shape_str: str, origin_x: float, origin_y: float) -> EEText:
     Format: T~type~x~y~rotation~color~font~size~?~?~anchor~?~text~...
     Example: T~L~400~290~0~#0000FF~Tahoma~11.5pt~0.1~~middle~comment~RP2040~1~middle~gge860~0~pinpart
     """
-    parts = shape_str.split("~")
+    parts = shape_str.split("~", 13)
     try:
         x = float(parts[2])
         y = float(parts[3])
@@ -928,6 +898,22 @@ def _parse_sym_arc(shape_str: str, origin_x: float, origin_y: float) -> EEArc:
     )
 
 
+# Shape type -> (parser, EESymbol list attribute the result is appended to)
+_SYMBOL_SHAPE_PARSERS = {
+    # Pins use ^^ as sub-delimiter within the shape string
+    "P": (_parse_pin, "pins"),
+    "R": (_parse_sym_rect, "rectangles"),
+    "E": (_parse_sym_circle, "circles"),
+    "PL": (_parse_sym_polyline, "polylines"),
+    "PG": (_parse_sym_polyline, "polylines"),
+    "A": (_parse_sym_arc, "arcs"),
+    "PT": (_parse_sym_path, "polylines"),
+    # C~ is circle (different from E~ ellipse in some versions)
+    "C": (_parse_sym_circle_c, "circles"),
+    "T": (_parse_sym_text, "texts"),
+}
+
+
 def compute_arc_midpoint(
     start: Tuple[float, float], end: Tuple[float, float], rx: float, ry: float, large_arc: int, sweep: int
 ) -> Tuple[float, float]:
@@ -942,44 +928,33 @@ def compute_arc_midpoint(
     # Direction perpendicular to chord
     dx = ex - sx
     dy = ey - sy
-    chord_len = math.sqrt(dx * dx + dy * dy)
+    chord_len = math.hypot(dx, dy)
     if chord_len < 1e-10:
         return (mx, my)
+    half_chord = chord_len / 2
 
-    # Use average radius
+    # Use average radius, but at least half the chord so the arc can span it
     r = (rx + ry) / 2
-    if r < chord_len / 2:
-        r = chord_len / 2
+    if r < half_chord:
+        r = half_chord
 
     # Distance from midpoint to center
-    h = math.sqrt(max(0, r * r - (chord_len / 2) ** 2))
+    h_sq = r * r - half_chord * half_chord
+    h = math.sqrt(h_sq) if h_sq > 0 else 0.0
 
     # Perpendicular direction (normalized)
     px = -dy / chord_len
     py = dx / chord_len
 
-    # Choose center side based on large_arc and sweep
-    if large_arc != sweep:
-        cx = mx + h * px
-        cy = my + h * py
-    else:
-        cx = mx - h * px
-        cy = my - h * py
-
-    # Midpoint on arc: angle bisector from center
-    a_start = math.atan2(sy - cy, sx - cx)
-    a_end = math.atan2(ey - cy, ex - cx)
-
-    # Handle angle wrapping based on sweep direction
-    if sweep == 1:
-        if a_end <= a_start:
-            a_end += 2 * math.pi
-    else:
-        if a_end >= a_start:
-            a_end -= 2 * math.pi
+    # Signed distance of the center from the chord midpoint along the
+    # perpendicular; the side is chosen by large_arc and sweep.
+    center_offset = h if large_arc != sweep else -h
 
-    a_mid = (a_start + a_end) / 2
-    mid_x = cx + r * math.cos(a_mid)
-    mid_y = cy + r * math.sin(a_mid)
+    # Travelling from start to end in the sweep direction, the arc always
+    # bulges to the same side of the chord, so its midpoint lies one radius
+    # from the center on that side - no angles needed.
+    mid_offset = center_offset - r if sweep == 1 else center_offset + r
+    mid_x = mx + mid_offset * px
+    mid_y = my + mid_offset * py
 
     return (mid_x, mid_y)
@@ -1,13 +1,20 @@
 """Library file management - create/append symbols, save footprints, update lib-tables."""
 
 import json
+import mmap
 import os
 import re
+import stat
 import sys
+import time
+import uuid
+from types import MappingProxyType
+from typing import Iterable, List, Tuple
 
 from .version import DEFAULT_KICAD_VERSION, has_generator_version, symbol_format_version, version_dir_name
 
-_DEFAULT_CONFIG = {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": False}
+# Read-only: load_config() hands out copies merged with the stored values
+_DEFAULT_CONFIG = MappingProxyType({"lib_name": "JLCImport", "global_lib_dir": "", "use_global": False})
 
 
 def _config_path() -> str:
@@ -15,41 +22,68 @@ def _config_path() -> str:
     return os.path.join(_kicad_config_base(), "jlcimport.json")
 
 
+# Parsed config per path, keyed on the (mtime_ns, size) of the file it was read from.
+_config_cache: dict = {}
+
+
 def load_config() -> dict:
     """Load config from jlcimport.json, returning defaults for missing keys.
 
     Auto-creates the file if missing and backfills any new default keys
-    into existing files.
+    into existing files. The parsed file is cached until it changes on disk;
+    callers always receive their own copy.
     """
-    config = dict(_DEFAULT_CONFIG)
     path = _config_path()
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is not None:
+        cached = _config_cache.get(path)
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            return dict(cached[1])
+
+    config = None
     needs_write = False
-    if os.path.exists(path):
+    if st is not None:
         try:
-            with open(path, encoding="utf-8") as f:
-                stored = json.load(f)
+            # One binary read; json.loads decodes the UTF-8 bytes itself
+            with open(path, "rb") as f:
+                stored = json.loads(f.read())
             if isinstance(stored, dict):
                 # Check if any default keys are missing from stored config
-                for key in _DEFAULT_CONFIG:
-                    if key not in stored:
-                        needs_write = True
-                config.update(stored)
-        except (json.JSONDecodeError, OSError):
+                needs_write = not _DEFAULT_CONFIG.keys() <= stored.keys()
+                config = {**_DEFAULT_CONFIG, **stored}
+        except (ValueError, OSError):
+            # Malformed JSON or undecodable bytes: rewrite with defaults
             needs_write = True
     else:
         needs_write = True
+    if config is None:
+        config = dict(_DEFAULT_CONFIG)
     if needs_write:
         save_config(config)
+    else:
+        _config_cache[path] = ((st.st_mtime_ns, st.st_size), dict(config))
     return config
 
 
 def save_config(config: dict) -> None:
-    """Save config to jlcimport.json."""
+    """Save config to jlcimport.json.
+
+    The new contents are fsynced before they replace the file, so an
+    interrupted save or a crash leaves either the previous or the new
+    config rather than a truncated one. A complete config is cached as written, so the
+    next load_config() does not re-read the file.
+    """
     path = _config_path()
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
-        f.write("\n")
+    _config_cache.pop(path, None)
+    _write_atomic(path, (json.dumps(config, indent=2) + "\n").encode("utf-8"))
+    # A partial config still needs load_config() to backfill defaults
+    if _DEFAULT_CONFIG.keys() <= config.keys():
+        st = os.stat(path)
+        _config_cache[path] = ((st.st_mtime_ns, st.st_size), dict(config))
 
 
 def ensure_lib_structure(base_path: str, lib_name: str = "JLCImport") -> dict:
@@ -57,9 +91,10 @@ def ensure_lib_structure(base_path: str, lib_name: str = "JLCImport") -> dict:
 
     Returns dict with paths: sym_path, fp_dir, models_dir
     """
-    sym_path = os.path.join(base_path, f"{lib_name}.kicad_sym")
-    fp_dir = os.path.join(base_path, f"{lib_name}.pretty")
-    models_dir = os.path.join(base_path, f"{lib_name}.3dshapes")
+    prefix = os.path.join(base_path, lib_name)
+    sym_path = f"{prefix}.kicad_sym"
+    fp_dir = f"{prefix}.pretty"
+    models_dir = f"{prefix}.3dshapes"
 
     os.makedirs(fp_dir, exist_ok=True)
     os.makedirs(models_dir, exist_ok=True)
@@ -83,70 +118,160 @@ def add_symbol_to_lib(
     Creates the library file if it doesn't exist.
     Returns True if symbol was added/replaced, False if it already exists and overwrite=False.
     """
+    return bool(add_symbols_to_lib(sym_path, [(name, content)], overwrite, kicad_version=kicad_version))
+
+
+def add_symbols_to_lib(
+    sym_path: str,
+    symbols: Iterable[Tuple[str, str]],
+    overwrite: bool = False,
+    kicad_version: int = DEFAULT_KICAD_VERSION,
+) -> List[str]:
+    """Add several symbols to the .kicad_sym library file with a single write.
+
+    ``symbols`` is an iterable of ``(name, content)`` pairs. Creates the library
+    file if it doesn't exist. Symbols that already exist are skipped unless
+    overwrite=True; if a name repeats within ``symbols`` the last content wins
+    when overwriting and the first otherwise.
+    Returns the names of the symbols written to the file (added or replaced),
+    in order; an empty list means nothing was written.
+    """
+    existing = _load_symbol_index(sym_path) if os.path.exists(sym_path) else set()
+    pending = {}
+    for name, content in symbols:
+        if (name in existing or name in pending) and not overwrite:
+            continue
+        pending[name] = content.encode()
+    if not pending:
+        return []
+
+    data = b"".join(pending.values())
+    replaced = existing.intersection(pending)
     if not os.path.exists(sym_path):
-        # Create new library with this symbol
+        # Create new library with these symbols
         header = "(kicad_symbol_lib\n"
         header += f"  (version {symbol_format_version(kicad_version)})\n"
         header += '  (generator "JLCImport")\n'
         if has_generator_version(kicad_version):
             header += '  (generator_version "1.0")\n'
-        with open(sym_path, "w", encoding="utf-8") as f:
-            f.write(header)
-            f.write(content)
-            f.write(")\n")
-        return True
-
-    # Read existing library
-    with open(sym_path, encoding="utf-8") as f:
-        lib_content = f.read()
-
-    # Check if symbol already exists
-    search_str = f'(symbol "{name}"'
-    if search_str in lib_content:
-        if not overwrite:
-            return False
-        # Remove existing symbol block
-        lib_content = _remove_symbol(lib_content, name)
-
-    # Insert before final closing paren
-    last_paren = lib_content.rfind(")")
-    if last_paren == -1:
-        return False
-
-    new_content = lib_content[:last_paren] + content + ")\n"
-    with open(sym_path, "w", encoding="utf-8") as f:
-        f.write(new_content)
-
-    return True
+        lib_content = header.encode()
+    else:
+        with open(sym_path, "rb") as f:
+            lib_content = f.read()
+        if replaced:
+            lib_content = _remove_symbols_bytes(lib_content, replaced)
+        # Insert before final closing paren
+        last_paren = lib_content.rfind(b")")
+        if last_paren == -1:
+            return []
+        lib_content = lib_content[:last_paren]
+
+    # Replaced as a whole, like the lib tables, so a failed write cannot truncate the library
+    _write_atomic(sym_path, lib_content + data + b")\n")
+    # Just written, so too recent to trust a stat-keyed entry for
+    _symbol_index_cache.pop(sym_path, None)
+    return list(pending)
+
+
+_SYMBOL_NAME_RE = re.compile(rb'\(symbol "([^"]*)"')
+_LPAREN = ord("(")
+_RPAREN = ord(")")
+_NEWLINES = b"\r\n"
+_INDENT = b" \t"
+_SEXPR_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[()]')
+_SYMBOL_HEAD_RE = re.compile(rb'\(symbol "((?:[^"\\]|\\.)*)"')
+
+# Symbol names per library path, keyed on the file's stat so that edits made
+# outside this process (e.g. in KiCad's symbol editor) invalidate the entry.
+# File timestamps can be as coarse as 2 s (FAT/exFAT, some network mounts), so
+# a same-size edit within one tick keeps the key. Names are therefore only
+# cached once the scanned file is older than that window.
+_symbol_index_cache: dict = {}
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
+
+def _symbol_names(data) -> set:
+    """Collect every ``(symbol "...")`` name in a bytes-like library buffer."""
+    return {m.group(1).decode() for m in _SYMBOL_NAME_RE.finditer(data)}
+
+
+def _load_symbol_index(sym_path: str) -> set:
+    """Return the set of symbol names in a library, rescanning only when it changed."""
+    st = os.stat(sym_path)
+    key = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+    cached = _symbol_index_cache.get(sym_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    scanned_at = time.time_ns()
+    if st.st_size == 0:
+        names = set()
+    else:
+        with open(sym_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            names = _symbol_names(mm)
+    if scanned_at - st.st_mtime_ns > _MTIME_GRANULARITY_NS:
+        _symbol_index_cache[sym_path] = (key, names)
+    else:
+        _symbol_index_cache.pop(sym_path, None)
+    return names
 
 
 def _remove_symbol(lib_content: str, name: str) -> str:
     """Remove a symbol block from library content."""
-    search = f'  (symbol "{name}"'
-    start = lib_content.find(search)
-    if start == -1:
+    return _remove_symbols_bytes(lib_content.encode(), {name}).decode()
+
+
+def _remove_symbols_bytes(lib_content: bytes, names) -> bytes:
+    """Remove the top-level symbol blocks with the given names from raw library bytes.
+
+    All blocks are located in one scan and cut out in one join, so removing
+    many symbols costs the same as removing one.
+    """
+    spans = _symbol_spans(lib_content)
+    cuts = sorted(spans[name] for name in names if name in spans)
+    if not cuts:
         return lib_content
 
-    # Find matching closing paren by counting depth
+    parts = []
+    pos = 0
+    for start, end in cuts:
+        parts.append(lib_content[pos:start])
+        pos = end
+    parts.append(lib_content[pos:])
+    return b"".join(parts)
+
+
+def _symbol_spans(lib_content: bytes) -> dict:
+    """Map each top-level symbol name to the byte span of its block.
+
+    Spans start at the beginning of the symbol's line (including indentation)
+    and end after any newlines following its closing paren. Quoted strings are
+    skipped so parens inside property values don't affect the depth count.
+    """
+    spans = {}
     depth = 0
-    i = start
-    in_symbol = False
-    while i < len(lib_content):
-        c = lib_content[i]
-        if c == "(":
+    name = None
+    start = 0
+    for m in _SEXPR_TOKEN_RE.finditer(lib_content):
+        c = lib_content[m.start()]
+        if c == _LPAREN:
+            if depth == 1:
+                head = _SYMBOL_HEAD_RE.match(lib_content, m.start())
+                if head:
+                    name = head.group(1).decode()
+                    start = m.start()
+                    while start > 0 and lib_content[start - 1] in _INDENT:
+                        start -= 1
             depth += 1
-            in_symbol = True
-        elif c == ")":
+        elif c == _RPAREN:
             depth -= 1
-            if in_symbol and depth == 0:
-                # Found the end - include trailing newline
-                end = i + 1
-                while end < len(lib_content) and lib_content[end] in ("\n", "\r"):
+            if depth == 1 and name is not None:
+                end = m.end()
+                while end < len(lib_content) and lib_content[end] in _NEWLINES:
                     end += 1
-                return lib_content[:start] + lib_content[end:]
-        i += 1
-
-    return lib_content
+                spans.setdefault(name, (start, end))
+                name = None
+    return spans
 
 
 def save_footprint(fp_dir: str, name: str, content: str, overwrite: bool = False) -> bool:
@@ -155,11 +280,11 @@ def save_footprint(fp_dir: str, name: str, content: str, overwrite: bool = False
     Returns True if saved, False if exists and overwrite=False.
     """
     fp_path = os.path.join(fp_dir, f"{name}.kicad_mod")
-    if os.path.exists(fp_path) and not overwrite:
+    if not overwrite and os.path.exists(fp_path):
         return False
 
-    with open(fp_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    with open(fp_path, "wb") as f:
+        f.write(content.encode())
     return True
 
 
@@ -170,9 +295,15 @@ def update_project_lib_tables(project_dir: str, lib_name: str = "JLCImport") ->
     """
     sym_uri = f"${{KIPRJMOD}}/{lib_name}.kicad_sym"
     fp_uri = f"${{KIPRJMOD}}/{lib_name}.pretty"
-    new_sym = _update_lib_table(os.path.join(project_dir, "sym-lib-table"), "sym_lib_table", lib_name, "KiCad", sym_uri)
-    new_fp = _update_lib_table(os.path.join(project_dir, "fp-lib-table"), "fp_lib_table", lib_name, "KiCad", fp_uri)
-    return new_sym or new_fp
+    return _update_lib_tables(
+        [
+            (os.path.join(project_dir, "sym-lib-table"), "sym_lib_table", lib_name, "KiCad", sym_uri),
+            (os.path.join(project_dir, "fp-lib-table"), "fp_lib_table", lib_name, "KiCad", fp_uri),
+        ]
+    )
+
+
+_VERSION_DIR_RE = re.compile(r"^\d+\.\d+$")
 
 
 def _detect_kicad_version() -> str:
@@ -193,16 +324,10 @@ def _detect_kicad_version() -> str:
     # Fall back: find newest version directory
     base = _kicad_data_base()
     try:
-        if os.path.isdir(base):
-            versions = []
-            for d in os.listdir(base):
-                try:
-                    versions.append((float(d), d))
-                except ValueError:
-                    continue
-            if versions:
-                versions.sort(reverse=True)
-                return versions[0][1]
+        with os.scandir(base) as it:
+            versions = [e.name for e in it if _VERSION_DIR_RE.match(e.name) and e.is_dir()]
+        if versions:
+            return max(versions, key=lambda v: tuple(int(x) for x in v.split(".")))
     except OSError:
         pass
 
@@ -262,8 +387,12 @@ def update_global_lib_tables(
     sym_uri = os.path.join(lib_dir, f"{lib_name}.kicad_sym").replace("\\", "/")
     fp_uri = os.path.join(lib_dir, f"{lib_name}.pretty").replace("\\", "/")
 
-    _update_lib_table(os.path.join(config_dir, "sym-lib-table"), "sym_lib_table", lib_name, "KiCad", sym_uri)
-    _update_lib_table(os.path.join(config_dir, "fp-lib-table"), "fp_lib_table", lib_name, "KiCad", fp_uri)
+    _update_lib_tables(
+        [
+            (os.path.join(config_dir, "sym-lib-table"), "sym_lib_table", lib_name, "KiCad", sym_uri),
+            (os.path.join(config_dir, "fp-lib-table"), "fp_lib_table", lib_name, "KiCad", fp_uri),
+        ]
+    )
 
 
 def _update_lib_table(table_path: str, table_type: str, lib_name: str, lib_type: str, uri: str) -> bool:
@@ -271,29 +400,88 @@ def _update_lib_table(table_path: str, table_type: str, lib_name: str, lib_type:
 
     Returns True if the file was newly created.
     """
-    entry = f'  (lib (name "{lib_name}")(type "{lib_type}")(uri "{uri}")(options "")(descr ""))'
+    content, created = _lib_table_content(table_path, table_type, lib_name, lib_type, uri)
+    if content is not None:
+        _write_atomic(table_path, content)
+    return created
+
+
+def _update_lib_tables(updates: list) -> bool:
+    """Apply several lib-table updates, writing only once every new table has been built.
+
+    Each update is a ``(table_path, table_type, lib_name, lib_type, uri)`` tuple.
+    Returns True if any table was newly created.
+    """
+    pending = []
+    any_created = False
+    for table_path, table_type, lib_name, lib_type, uri in updates:
+        content, created = _lib_table_content(table_path, table_type, lib_name, lib_type, uri)
+        if content is not None:
+            pending.append((table_path, content))
+        any_created = any_created or created
+    for table_path, content in pending:
+        _write_atomic(table_path, content)
+    return any_created
+
+
+def _lib_table_content(table_path: str, table_type: str, lib_name: str, lib_type: str, uri: str) -> tuple:
+    """Build the new contents of a lib-table file with the entry added.
+
+    Returns ``(content, created)`` where content is None if the file needs
+    no change and created is True if the file does not exist yet.
+    """
+    entry = f'  (lib (name "{lib_name}")(type "{lib_type}")(uri "{uri}")(options "")(descr ""))'.encode()
 
     if os.path.exists(table_path):
-        with open(table_path, encoding="utf-8") as f:
+        with open(table_path, "rb") as f:
             content = f.read()
-        if f'(name "{lib_name}")' in content:
-            return False
-        last_paren = content.rfind(")")
+        if b'(name "' + lib_name.encode() + b'")' in content:
+            return None, False
+        last_paren = content.rfind(b")")
         if last_paren >= 0:
-            new_content = content[:last_paren] + entry + "\n)\n"
-            with open(table_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
-        return False
-    else:
-        with open(table_path, "w", encoding="utf-8") as f:
-            f.write(f"({table_type}\n")
-            f.write("  (version 7)\n")
-            f.write(entry + "\n")
-            f.write(")\n")
-        return True
+            return content[:last_paren] + entry + b"\n)\n", False
+        return None, False
+    return f"({table_type}\n  (version 7)\n".encode() + entry + b"\n)\n", True
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file by replacing it with a fully written sibling temp file.
+
+    The data is fsynced before the rename, so a crash cannot leave the
+    renamed file empty or truncated. A symlinked ``path`` has its target
+    replaced, so the link survives. An existing file's permission bits are
+    carried over; a new file gets the usual umask-derived mode.
+    """
+    path = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    # A unique name per write, so concurrent writers never share a temp file
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o666 if mode is None else 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
+_WINDOWS_RESERVED = frozenset(
+    ["CON", "PRN", "AUX", "NUL", *(f"COM{i}" for i in range(10)), *(f"LPT{i}" for i in range(10))]
+)
 
-_WINDOWS_RESERVED = re.compile(r"^(CON|PRN|AUX|NUL|COM[0-9]|LPT[0-9])$", re.IGNORECASE)
+# Runs of characters that aren't alphanumeric or hyphen, including existing
+# underscores, so that replacing and collapsing happen in a single pass.
+_NAME_SEPARATOR_RUN_RE = re.compile(r"[^A-Za-z0-9\-]+")
 
 
 def sanitize_name(title: str) -> str:
@@ -302,13 +490,10 @@ def sanitize_name(title: str) -> str:
     Strips all path separators and special characters to produce a safe
     base filename. Rejects Windows reserved device names.
     """
-    # Replace any character that isn't alphanumeric, hyphen, or underscore
-    name = re.sub(r"[^A-Za-z0-9_\-]", "_", title)
-    # Collapse multiple underscores
-    name = re.sub(r"_+", "_", name)
-    name = name.strip("_")
+    # Replace each run of characters that aren't alphanumeric or hyphen with one underscore
+    name = _NAME_SEPARATOR_RUN_RE.sub("_", title).strip("_")
     # Reject Windows reserved device names
-    if _WINDOWS_RESERVED.match(name):
+    if name.upper() in _WINDOWS_RESERVED:
         name = "_" + name
     if not name:
         name = "unnamed"
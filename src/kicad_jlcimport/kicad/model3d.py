@@ -15,6 +15,7 @@ Both files are still saved for compatibility, but KiCad footprints reference the
 
 import math
 import os
+import re
 from typing import Optional, Tuple
 
 from ..easyeda.ee_types import EE3DModel
@@ -210,34 +211,37 @@ def compute_model_transform(
     return offset, model.rotation
 
 
-def _obj_bounding_box(obj_source: str) -> Tuple[float, float, float, float]:
-    """Return XY center and Z range of OBJ vertex data (cx, cy, z_min, z_max in mm)."""
-    min_x = min_y = min_z = float("inf")
-    max_x = max_y = max_z = float("-inf")
-    found = False
+# "v x y z" vertex statements (not "vn"/"vt"), one per line
+_OBJ_VERTEX_RE = re.compile(r"^[ \t]*v [ \t]*(\S+)[ \t]+(\S+)[ \t]+(\S+)", re.MULTILINE)
 
-    for line in obj_source.split("\n"):
-        line = line.strip()
-        if not line.startswith("v ") or line.startswith("vn") or line.startswith("vt"):
-            continue
-        parts = line.split()
-        if len(parts) < 4:
-            continue
-        try:
-            x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-        except ValueError:
-            continue
-        min_x, max_x = min(min_x, x), max(max_x, x)
-        min_y, max_y = min(min_y, y), max(max_y, y)
-        min_z, max_z = min(min_z, z), max(max_z, z)
-        found = True
 
-    if not found:
+def _obj_bounding_box(obj_source: str) -> Tuple[float, float, float, float]:
+    """Return XY center and Z range of OBJ vertex data (cx, cy, z_min, z_max in mm)."""
+    # Extract all vertex fields in one regex scan and convert them column-wise,
+    # so the extrema are found by one C-level min()/max() per axis.
+    fields = _OBJ_VERTEX_RE.findall(obj_source)
+    try:
+        xs = [float(f[0]) for f in fields]
+        ys = [float(f[1]) for f in fields]
+        zs = [float(f[2]) for f in fields]
+    except ValueError:
+        # Rare malformed vertex: fall back to skipping bad entries one by one
+        xs, ys, zs = [], [], []
+        for fx, fy, fz in fields:
+            try:
+                x, y, z = float(fx), float(fy), float(fz)
+            except ValueError:
+                continue
+            xs.append(x)
+            ys.append(y)
+            zs.append(z)
+
+    if not xs:
         return 0.0, 0.0, 0.0, 0.0
 
-    cx = (min_x + max_x) / 2
-    cy = (min_y + max_y) / 2
-    return cx, cy, min_z, max_z
+    cx = (min(xs) + max(xs)) / 2
+    cy = (min(ys) + max(ys)) / 2
+    return cx, cy, min(zs), max(zs)
 
 
 def _obj_xy_center(obj_source: str) -> Tuple[float, float]:
@@ -288,8 +292,9 @@ def save_models(
     if wrl_source is not None:
         wrl_content = convert_to_vrml(wrl_source)
         if wrl_content:
-            with open(wrl_path, "w", encoding="utf-8") as f:
-                f.write(wrl_content)
+            # Encode once and hand the whole buffer to a single binary write
+            with open(wrl_path, "wb") as f:
+                f.write(wrl_content.encode())
             wrl_out = wrl_path
         elif os.path.exists(wrl_path):
             wrl_out = wrl_path
@@ -303,74 +308,80 @@ def save_models(
     return step_out, wrl_out
 
 
+def _parse_face_indices(tokens: list) -> list:
+    """Convert OBJ face tokens (``v``, ``v/t``, ``v//n``, ``v/t/n``) to 0-based vertex indices."""
+    try:
+        return [int(t.split("/", 1)[0]) - 1 for t in tokens]
+    except ValueError:
+        pass
+    indices = []
+    for t in tokens:
+        try:
+            indices.append(int(t.split("/", 1)[0]) - 1)
+        except ValueError:
+            continue
+    return indices
+
+
 def convert_to_vrml(obj_source: str) -> Optional[str]:
     """Convert EasyEDA OBJ-like 3D text format to VRML 2.0."""
     materials = {}
-    vertices = []
+    # Vertex coordinates are kept as three parallel columns (already in VRML units)
+    xs = []
+    ys = []
+    zs = []
     shape_groups = []
 
-    lines = obj_source.split("\n")
-
-    # Parse materials
+    # Parse materials, vertices and faces in one pass, dispatching on the
+    # statement keyword instead of probing every line with several prefixes.
     current_mtl = None
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        if line.startswith("newmtl "):
+    for raw in obj_source.split("\n"):
+        line = raw.strip()
+        keyword, _, rest = line.partition(" ")
+        if keyword == "v":
+            parts = rest.split()
+            if len(parts) >= 3:
+                # Divide by 2.54 to convert from mils to VRML units
+                xs.append(float(parts[0]) / 2.54)
+                ys.append(float(parts[1]) / 2.54)
+                zs.append(float(parts[2]) / 2.54)
+        elif keyword == "f":
+            if shape_groups:
+                # Parse face: f v1//n1 v2//n2 v3//n3
+                face_indices = _parse_face_indices(rest.split())
+                if len(face_indices) >= 3:
+                    shape_groups[-1]["faces"].append(face_indices)
+        elif keyword == "usemtl":
+            shape_groups.append({"material": rest.strip(), "faces": []})
+        elif keyword == "newmtl":
             current_mtl = {
-                "name": line[7:].strip(),
+                "name": rest.strip(),
                 "Ka": (0.2, 0.2, 0.2),
                 "Kd": (0.8, 0.8, 0.8),
                 "Ks": (0, 0, 0),
                 "d": 0,
             }
-        elif line.startswith("Ka ") and current_mtl:
-            parts = line.split()
-            if len(parts) >= 4:
-                current_mtl["Ka"] = (float(parts[1]), float(parts[2]), float(parts[3]))
-        elif line.startswith("Kd ") and current_mtl:
-            parts = line.split()
-            if len(parts) >= 4:
-                current_mtl["Kd"] = (float(parts[1]), float(parts[2]), float(parts[3]))
-        elif line.startswith("Ks ") and current_mtl:
-            parts = line.split()
-            if len(parts) >= 4:
-                current_mtl["Ks"] = (float(parts[1]), float(parts[2]), float(parts[3]))
-        elif line.startswith("d ") and current_mtl:
-            parts = line.split()
-            if len(parts) >= 2:
-                current_mtl["d"] = float(parts[1])
-        elif line == "endmtl" and current_mtl:
-            materials[current_mtl["name"]] = current_mtl
-            current_mtl = None
-        elif line.startswith("v ") and not line.startswith("vn") and not line.startswith("vt"):
-            parts = line.split()
-            if len(parts) >= 4:
-                # Divide by 2.54 to convert from mils to VRML units
-                x = float(parts[1]) / 2.54
-                y = float(parts[2]) / 2.54
-                z = float(parts[3]) / 2.54
-                vertices.append((x, y, z))
-        elif line.startswith("usemtl "):
-            mtl_name = line[7:].strip()
-            shape_groups.append({"material": mtl_name, "faces": []})
-        elif line.startswith("f ") and shape_groups:
-            # Parse face: f v1//n1 v2//n2 v3//n3
-            parts = line.split()[1:]
-            face_indices = []
-            for p in parts:
-                idx_str = p.split("//")[0].split("/")[0]
-                try:
-                    face_indices.append(int(idx_str) - 1)  # 1-based to 0-based
-                except ValueError:
-                    continue
-            if len(face_indices) >= 3:
-                shape_groups[-1]["faces"].append(face_indices)
-        i += 1
-
-    if not vertices or not shape_groups:
+        elif current_mtl:
+            if keyword in ("Ka", "Kd", "Ks"):
+                parts = rest.split()
+                if len(parts) >= 3:
+                    current_mtl[keyword] = (float(parts[0]), float(parts[1]), float(parts[2]))
+            elif keyword == "d":
+                parts = rest.split()
+                if parts:
+                    current_mtl["d"] = float(parts[0])
+            elif line == "endmtl":
+                materials[current_mtl["name"]] = current_mtl
+                current_mtl = None
+
+    if not xs or not shape_groups:
         return None
 
+    # Format every vertex once as a complete "point [...]" entry; groups that
+    # share vertices then reuse the strings instead of reformatting the floats.
+    point_lines = [f"        {x:.6f} {y:.6f} {z:.6f}," for x, y, z in zip(xs, ys, zs)]
+    vertex_count = len(point_lines)
+
     # Generate VRML 2.0
     vrml_lines = ["#VRML V2.0 utf8", ""]
 
@@ -389,19 +400,15 @@ def convert_to_vrml(obj_source: str) -> Optional[str]:
         sorted_indices = sorted(used_indices)
         global_to_local = {g: local_idx for local_idx, g in enumerate(sorted_indices)}
 
-        # Build point array
-        points = []
-        for gi in sorted_indices:
-            if gi < len(vertices):
-                v = vertices[gi]
-                points.append(f"{v[0]:.6f} {v[1]:.6f} {v[2]:.6f}")
+        # Build point array from the preformatted vertex lines
+        points = [point_lines[gi] for gi in sorted_indices if gi < vertex_count]
 
         # Build coordIndex
         coord_indices = []
         for face in group["faces"]:
             local_face = [str(global_to_local[gi]) for gi in face if gi in global_to_local]
             if len(local_face) >= 3:
-                coord_indices.append(", ".join(local_face) + ", -1")
+                coord_indices.append(f"      {', '.join(local_face)}, -1,")
 
         if not points or not coord_indices:
             continue
@@ -425,13 +432,11 @@ def convert_to_vrml(obj_source: str) -> Optional[str]:
         vrml_lines.append("    solid FALSE")
         vrml_lines.append("    coord DEF co Coordinate {")
         vrml_lines.append("      point [")
-        for pt in points:
-            vrml_lines.append(f"        {pt},")
+        vrml_lines.extend(points)
         vrml_lines.append("      ]")
         vrml_lines.append("    }")
         vrml_lines.append("    coordIndex [")
-        for ci in coord_indices:
-            vrml_lines.append(f"      {ci},")
+        vrml_lines.extend(coord_indices)
         vrml_lines.append("    ]")
         vrml_lines.append("  }")
         vrml_lines.append("}")
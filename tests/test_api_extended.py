@@ -436,6 +436,18 @@ class TestFetchFullComponent:
                 # Links not starting with http or // should be empty
                 assert result["datasheet"] == ""
 
+    def test_fetch_full_component_reuses_given_uuids(self):
+        """Prefetched UUIDs are used without another lookup."""
+        mock_uuids = [{"component_uuid": "fp_uuid"}]
+        mock_fp_data = {"title": "Test", "dataStr": {"shape": [], "head": {"c_para": {"pre": "R?"}}}}
+
+        with patch.object(api, "fetch_component_uuids") as mock_lookup:
+            with patch.object(api, "fetch_component_data", return_value=mock_fp_data):
+                result = api.fetch_full_component("C789", uuids=mock_uuids)
+
+        mock_lookup.assert_not_called()
+        assert result["footprint_uuid"] == "fp_uuid"
+
 
 class TestFetchProductImageExtended:
     """Extended tests for fetch_product_image."""
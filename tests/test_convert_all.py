@@ -5,11 +5,14 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 from kicad_jlcimport.easyeda.parser import parse_footprint_shapes, parse_symbol_shapes
 from kicad_jlcimport.kicad.footprint_writer import write_footprint
 from kicad_jlcimport.kicad.symbol_writer import write_symbol, write_symbol_library
 
 
+@pytest.mark.slow
 def test_convert_all_testdata():
     """Convert all testdata JSON to KiCad files and SVGs."""
     testdata_dir = Path("testdata")
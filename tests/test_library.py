@@ -7,6 +7,7 @@ from kicad_jlcimport.kicad.library import (
     _remove_symbol,
     _update_lib_table,
     add_symbol_to_lib,
+    add_symbols_to_lib,
     ensure_lib_structure,
     sanitize_name,
     save_footprint,
@@ -29,6 +30,9 @@ class TestSanitizeName:
     def test_collapse_underscores(self):
         assert sanitize_name("a  b   c") == "a_b_c"
 
+    def test_collapse_mixed_separators_and_underscores(self):
+        assert sanitize_name("a_ _b/_/c__d") == "a_b_c_d"
+
     def test_strip_leading_trailing(self):
         assert sanitize_name("__name__") == "name"
 
@@ -58,6 +62,10 @@ class TestSanitizeName:
         result = sanitize_name("con")
         assert result == "_con"
 
+    def test_windows_reserved_prefix_not_reserved(self):
+        assert sanitize_name("CONN") == "CONN"
+        assert sanitize_name("COM10") == "COM10"
+
     def test_path_traversal_blocked(self):
         result = sanitize_name("../../etc/passwd")
         assert "/" not in result
@@ -68,6 +76,10 @@ class TestSanitizeName:
         result = sanitize_name("Resistance\u00b5F")
         assert all(c.isalnum() or c in ("_", "-") for c in result)
 
+    def test_non_ascii_alnum_replaced(self):
+        # Unicode letters/digits are alphanumeric but not portable in file names
+        assert sanitize_name("R\u00e9sistance\u00b2") == "R_sistance"
+
     def test_hyphen_preserved(self):
         assert sanitize_name("ESP32-S3") == "ESP32-S3"
 
@@ -96,6 +108,12 @@ class TestEnsureLibStructure:
             paths = ensure_lib_structure(tmpdir, "TestLib")
             assert os.path.isdir(paths["fp_dir"])
 
+    def test_trailing_separator_in_base_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = ensure_lib_structure(tmpdir + os.sep, "TestLib")
+            assert paths["sym_path"] == os.path.join(tmpdir, "TestLib.kicad_sym")
+            assert paths["fp_dir"] == os.path.join(tmpdir, "TestLib.pretty")
+
 
 class TestAddSymbolToLib:
     def test_creates_new_library(self):
@@ -245,3 +263,63 @@ class TestAddSymbolToLibVersions:
             assert "(version 20231120)" in text
             assert "generator_version" not in text
             assert '(generator "JLCImport")' in text
+
+
+class TestAddSymbolsToLib:
+    def test_creates_library_with_all_symbols(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sym_path = os.path.join(tmpdir, "test.kicad_sym")
+            added = add_symbols_to_lib(sym_path, [("R_100", '  (symbol "R_100")\n'), ("C_100", '  (symbol "C_100")\n')])
+            assert added == ["R_100", "C_100"]
+            with open(sym_path) as f:
+                text = f.read()
+            assert text.count("(kicad_symbol_lib") == 1
+            assert text.index('(symbol "R_100")') < text.index('(symbol "C_100")')
+            assert text.endswith(")\n")
+
+    def test_skips_existing_without_overwrite(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sym_path = os.path.join(tmpdir, "test.kicad_sym")
+            add_symbol_to_lib(sym_path, "R_100", '  (symbol "R_100"\n    (old)\n  )\n')
+            added = add_symbols_to_lib(
+                sym_path, [("R_100", '  (symbol "R_100"\n    (new)\n  )\n'), ("C_100", '  (symbol "C_100")\n')]
+            )
+            assert added == ["C_100"]
+            with open(sym_path) as f:
+                text = f.read()
+            assert "(old)" in text
+            assert "(new)" not in text
+
+    def test_overwrites_many_in_one_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sym_path = os.path.join(tmpdir, "test.kicad_sym")
+            add_symbols_to_lib(
+                sym_path,
+                [("A", '  (symbol "A"\n    (old)\n  )\n'), ("B", '  (symbol "B"\n    (old)\n  )\n')],
+            )
+            added = add_symbols_to_lib(
+                sym_path,
+                [("A", '  (symbol "A"\n    (new)\n  )\n'), ("B", '  (symbol "B"\n    (new)\n  )\n')],
+                overwrite=True,
+            )
+            assert added == ["A", "B"]
+            with open(sym_path) as f:
+                text = f.read()
+            assert "(old)" not in text
+            assert text.count("(new)") == 2
+
+    def test_duplicate_names_in_batch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sym_path = os.path.join(tmpdir, "test.kicad_sym")
+            added = add_symbols_to_lib(sym_path, [("A", '  (symbol "A" first)\n'), ("A", '  (symbol "A" second)\n')])
+            assert added == ["A"]
+            with open(sym_path) as f:
+                text = f.read()
+            assert "first" in text
+            assert "second" not in text
+
+    def test_empty_batch_does_not_create_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sym_path = os.path.join(tmpdir, "test.kicad_sym")
+            assert add_symbols_to_lib(sym_path, []) == []
+            assert not os.path.exists(sym_path)
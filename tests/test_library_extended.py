@@ -3,8 +3,11 @@
 import json
 import os
 import sys
+import time
 from unittest.mock import MagicMock
 
+import pytest
+
 from kicad_jlcimport.kicad import library
 
 
@@ -43,6 +46,14 @@ class TestLoadConfig:
         config = library.load_config()
         assert config["lib_name"] == "JLCImport"  # Falls back to default
 
+    def test_load_config_handles_non_utf8_file(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        config_file.write_bytes(b'{"lib_name": "\xff"}')
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+
+        config = library.load_config()
+        assert config["lib_name"] == "JLCImport"  # Falls back to default
+
     def test_load_config_handles_non_dict_json(self, tmp_path, monkeypatch):
         config_file = tmp_path / "jlcimport.json"
         config_file.write_text('"just a string"')
@@ -55,6 +66,10 @@ class TestLoadConfig:
         assert "global_lib_dir" in library._DEFAULT_CONFIG
         assert library._DEFAULT_CONFIG["global_lib_dir"] == ""
 
+    def test_default_config_is_read_only(self):
+        with pytest.raises(TypeError):
+            library._DEFAULT_CONFIG["lib_name"] = "Changed"
+
     def test_load_config_auto_creates_file_when_missing(self, tmp_path, monkeypatch):
         config_file = tmp_path / "jlcimport.json"
         monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
@@ -88,6 +103,71 @@ class TestLoadConfig:
         stored = json.loads(config_file.read_text())
         assert stored["extra_key"] == 42
 
+    def test_load_config_backfill_keeps_default_key_order(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        config_file.write_text(json.dumps({"extra_key": 1, "lib_name": "X"}))
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+
+        config = library.load_config()
+        assert list(config) == [*library._DEFAULT_CONFIG, "extra_key"]
+        assert config["lib_name"] == "X"
+        assert list(json.loads(config_file.read_text())) == list(config)
+
+    def test_load_config_cached_until_file_changes(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        config_file.write_text(json.dumps({"lib_name": "First", "global_lib_dir": "", "use_global": False}))
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+
+        assert library.load_config()["lib_name"] == "First"
+        real_loads = json.loads
+        calls = []
+        monkeypatch.setattr(library.json, "loads", lambda s: calls.append(s) or real_loads(s))
+        assert library.load_config()["lib_name"] == "First"
+        assert calls == []
+
+        config_file.write_text(json.dumps({"lib_name": "Second!", "global_lib_dir": "", "use_global": False}))
+        assert library.load_config()["lib_name"] == "Second!"
+        assert len(calls) == 1
+
+    def test_load_config_returns_independent_copies(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+
+        library.load_config()
+        first = library.load_config()
+        first["lib_name"] = "Mutated"
+        assert library.load_config()["lib_name"] == "JLCImport"
+
+    def test_save_config_invalidates_cache(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+
+        config = library.load_config()
+        config = library.load_config()
+        config["lib_name"] = "Saved"
+        library.save_config(config)
+        assert library.load_config()["lib_name"] == "Saved"
+
+    def test_save_config_primes_cache(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+
+        config = library.load_config()
+        config["lib_name"] = "Saved"
+        library.save_config(config)
+        monkeypatch.setattr(library.json, "loads", lambda s: pytest.fail("config re-read after save"))
+        assert library.load_config()["lib_name"] == "Saved"
+
+    def test_save_partial_config_backfilled_on_load(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+
+        library.save_config({"lib_name": "Partial"})
+        config = library.load_config()
+        assert config["lib_name"] == "Partial"
+        assert config["use_global"] is False
+        assert "use_global" in json.loads(config_file.read_text())
+
 
 class TestSaveConfig:
     """Tests for save_config function."""
@@ -112,6 +192,25 @@ class TestSaveConfig:
         data = json.loads(config_file.read_text())
         assert data["lib_name"] == "NewLib"
 
+    def test_failed_save_keeps_previous_config(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "jlcimport.json"
+        monkeypatch.setattr(library, "_config_path", lambda: str(config_file))
+        config = library.load_config()
+        original = config_file.read_text()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        config["lib_name"] = "NewLib"
+        with monkeypatch.context() as m:
+            m.setattr(library.os, "replace", fail_replace)
+            with pytest.raises(OSError):
+                library.save_config(config)
+
+        assert config_file.read_text() == original
+        assert [p.name for p in tmp_path.iterdir()] == ["jlcimport.json"]
+        assert library.load_config()["lib_name"] == "JLCImport"
+
 
 class TestDetectKicadVersion:
     """Tests for _detect_kicad_version function."""
@@ -160,6 +259,25 @@ class TestDetectKicadVersion:
         result = library._detect_kicad_version()
         assert result == "7.0"
 
+    def test_detect_version_compares_numerically(self, tmp_path, monkeypatch):
+        monkeypatch.delitem(sys.modules, "pcbnew", raising=False)
+
+        (tmp_path / "9.0").mkdir()
+        (tmp_path / "10.0").mkdir()
+        (tmp_path / "9.99").write_text("")  # Files are not version dirs
+
+        monkeypatch.setattr(library, "_kicad_data_base", lambda: str(tmp_path))
+
+        result = library._detect_kicad_version()
+        assert result == "10.0"
+
+    def test_detect_version_missing_base_dir(self, tmp_path, monkeypatch):
+        monkeypatch.delitem(sys.modules, "pcbnew", raising=False)
+        monkeypatch.setattr(library, "_kicad_data_base", lambda: str(tmp_path / "missing"))
+
+        result = library._detect_kicad_version()
+        assert result == "9.0"
+
 
 class TestKicadDataBase:
     """Tests for _kicad_data_base function."""
@@ -199,6 +317,11 @@ class TestKicadConfigBase:
         result = library._kicad_config_base()
         assert ".config/kicad" in result
 
+    def test_other_platform_uses_linux_path(self, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "freebsd13")
+        result = library._kicad_config_base()
+        assert ".config/kicad" in result
+
 
 class TestGetGlobalLibDir:
     """Tests for get_global_lib_dir function."""
@@ -326,6 +449,94 @@ class TestUpdateLibTableExtended:
         result = library._update_lib_table(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path/to/lib")
         assert result is False  # Appended to existing
 
+    def test_lib_table_content_unchanged_returns_none(self, tmp_path):
+        table_path = tmp_path / "sym-lib-table"
+        library._update_lib_table(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path")
+        content, created = library._lib_table_content(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path")
+        assert content is None
+        assert created is False
+
+    def test_already_present_is_not_read(self, tmp_path, monkeypatch):
+        table_path = tmp_path / "sym-lib-table"
+        library._update_lib_table(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path")
+        monkeypatch.setattr(library, "_write_atomic", lambda *a: pytest.fail("table rewritten"))
+        assert library._update_lib_table(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path") is False
+
+    def test_entry_found_among_many_lines(self, tmp_path):
+        table_path = tmp_path / "fp-lib-table"
+        entries = "".join(
+            f'  (lib (name "Lib{i}")(type "KiCad")(uri "/l{i}")(options "")(descr ""))\n' for i in range(50)
+        )
+        table_path.write_text(f"(fp_lib_table\n  (version 7)\n{entries})\n")
+        before = table_path.read_text()
+        assert library._update_lib_table(str(table_path), "fp_lib_table", "Lib0", "KiCad", "/l0") is False
+        assert table_path.read_text() == before
+
+    def test_empty_table_file(self, tmp_path):
+        table_path = tmp_path / "sym-lib-table"
+        table_path.write_bytes(b"")
+        assert library._update_lib_table(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path") is False
+        assert table_path.read_bytes() == b""
+
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        table_path = tmp_path / "sym-lib-table"
+        library._update_lib_table(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path")
+        assert [p.name for p in tmp_path.iterdir()] == ["sym-lib-table"]
+
+    def test_failed_write_keeps_original(self, tmp_path, monkeypatch):
+        table_path = tmp_path / "sym-lib-table"
+        table_path.write_text("(sym_lib_table\n  (version 7)\n)\n")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(library.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            library._update_lib_table(str(table_path), "sym_lib_table", "TestLib", "KiCad", "/path")
+        assert table_path.read_text() == "(sym_lib_table\n  (version 7)\n)\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["sym-lib-table"]
+
+    def test_write_is_fsynced_before_replace(self, tmp_path, monkeypatch):
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd):
+            calls.append("fsync")
+            real_fsync(fd)
+
+        def replace(src, dst):
+            calls.append("replace")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(library.os, "fsync", fsync)
+        monkeypatch.setattr(library.os, "replace", replace)
+        library._write_atomic(str(tmp_path / "jlcimport.json"), b"{}\n")
+        assert calls == ["fsync", "replace"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="mode bits are POSIX-only")
+    def test_new_file_gets_umask_mode_without_changing_umask(self, tmp_path, monkeypatch):
+        umask = os.umask(0o022)
+        os.umask(umask)
+        monkeypatch.setattr(library.os, "umask", lambda *a: pytest.fail("umask changed"))
+        path = tmp_path / "jlcimport.json"
+        library._write_atomic(str(path), b"{}\n")
+        assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks and mode bits are POSIX-only")
+    def test_write_through_symlink_keeps_link_and_mode(self, tmp_path):
+        target = tmp_path / "dotfiles" / "sym-lib-table"
+        target.parent.mkdir()
+        target.write_text("(sym_lib_table\n  (version 7)\n)\n")
+        target.chmod(0o600)
+        link = tmp_path / "sym-lib-table"
+        link.symlink_to(target)
+
+        assert library._update_lib_table(str(link), "sym_lib_table", "TestLib", "KiCad", "/path") is False
+        assert link.is_symlink()
+        assert '(name "TestLib")' in target.read_text()
+        assert target.stat().st_mode & 0o777 == 0o600
+        assert sorted(p.name for p in target.parent.iterdir()) == ["sym-lib-table"]
+
 
 class TestRemoveSymbolExtended:
     """Extended tests for _remove_symbol function."""
@@ -346,6 +557,33 @@ class TestRemoveSymbolExtended:
         assert '(symbol "R_100"' not in result
         assert "(kicad_symbol_lib" in result
 
+    def test_parens_inside_strings_ignored(self):
+        content = '(kicad_symbol_lib\n  (symbol "A"\n    (property "Value" "x)(y")\n  )\n  (symbol "B")\n)\n'
+        result = library._remove_symbol(content, "A")
+        assert result == '(kicad_symbol_lib\n  (symbol "B")\n)\n'
+
+    def test_tab_indented_library(self):
+        """Libraries re-saved by KiCad 8+ use tab indentation."""
+        content = '(kicad_symbol_lib\n\t(symbol "A"\n\t\t(pin_names)\n\t)\n\t(symbol "B")\n)\n'
+        result = library._remove_symbol(content, "A")
+        assert result == '(kicad_symbol_lib\n\t(symbol "B")\n)\n'
+
+    def test_does_not_match_unit_symbol(self):
+        content = '(kicad_symbol_lib\n  (symbol "A"\n    (symbol "A_0_1")\n  )\n)\n'
+        assert library._remove_symbol(content, "A_0_1") == content
+
+    def test_removes_many_in_one_pass(self):
+        content = b'(kicad_symbol_lib\n  (symbol "A")\n  (symbol "B")\n  (symbol "C")\n)\n'
+        result = library._remove_symbols_bytes(content, {"A", "C", "missing"})
+        assert result == b'(kicad_symbol_lib\n  (symbol "B")\n)\n'
+
+    def test_symbol_spans(self):
+        content = b'(kicad_symbol_lib\n  (symbol "A"\n    (symbol "A_0_1")\n  )\n  (symbol "B")\n)\n'
+        spans = library._symbol_spans(content)
+        assert set(spans) == {"A", "B"}
+        start, end = spans["B"]
+        assert content[start:end] == b'  (symbol "B")\n'
+
 
 class TestUpdateGlobalLibTablesBackslash:
     """Tests for backslash path handling in update_global_lib_tables."""
@@ -382,3 +620,101 @@ class TestAddSymbolToLibExtended:
         result = library.add_symbol_to_lib(str(sym_path), "Test", '  (symbol "Test")\n')
         # rfind(")") returns -1 when no ), so function returns False
         assert result is False
+        assert sym_path.read_text() == "(kicad_symbol_lib\n"
+
+    def test_append_after_trailing_padding(self, tmp_path):
+        """The closing paren is found even when followed by a long tail."""
+        sym_path = tmp_path / "test.kicad_sym"
+        sym_path.write_text("(kicad_symbol_lib\n)" + "\n" * 20000)
+
+        result = library.add_symbol_to_lib(str(sym_path), "Test", '  (symbol "Test")\n')
+        assert result is True
+        assert sym_path.read_text() == '(kicad_symbol_lib\n  (symbol "Test")\n)\n'
+
+    def test_failed_append_keeps_library(self, tmp_path, monkeypatch):
+        sym_path = tmp_path / "test.kicad_sym"
+        library.add_symbol_to_lib(str(sym_path), "R_100", '  (symbol "R_100")\n')
+        before = sym_path.read_bytes()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(library.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            library.add_symbol_to_lib(str(sym_path), "C_100", '  (symbol "C_100")\n')
+        assert sym_path.read_bytes() == before
+        assert [p.name for p in tmp_path.iterdir()] == ["test.kicad_sym"]
+
+
+class TestSymbolIndex:
+    """Tests for the in-process symbol name index used by add_symbol_to_lib."""
+
+    def test_index_lists_existing_symbols(self, tmp_path):
+        sym_path = tmp_path / "test.kicad_sym"
+        sym_path.write_text('(kicad_symbol_lib\n  (symbol "R_100"\n    (symbol "R_100_0_1")\n  )\n)\n')
+        names = library._load_symbol_index(str(sym_path))
+        assert names == {"R_100", "R_100_0_1"}
+
+    def test_index_empty_file(self, tmp_path):
+        sym_path = tmp_path / "empty.kicad_sym"
+        sym_path.write_bytes(b"")
+        assert library._load_symbol_index(str(sym_path)) == set()
+
+    def test_index_tracks_added_symbols(self, tmp_path):
+        sym_path = str(tmp_path / "test.kicad_sym")
+        library.add_symbol_to_lib(sym_path, "R_100", '  (symbol "R_100")\n')
+        library.add_symbol_to_lib(sym_path, "C_100", '  (symbol "C_100")\n')
+        assert library._load_symbol_index(sym_path) == {"R_100", "C_100"}
+
+    def test_index_invalidated_by_external_edit(self, tmp_path):
+        sym_path = tmp_path / "test.kicad_sym"
+        library.add_symbol_to_lib(str(sym_path), "R_100", '  (symbol "R_100")\n')
+        # Simulate the library being rewritten by another program
+        sym_path.write_text('(kicad_symbol_lib\n  (symbol "X_1")\n)\n')
+        assert library._load_symbol_index(str(sym_path)) == {"X_1"}
+        assert library.add_symbol_to_lib(str(sym_path), "R_100", '  (symbol "R_100")\n') is True
+
+    def test_index_cached_for_settled_file(self, tmp_path):
+        sym_path = tmp_path / "test.kicad_sym"
+        sym_path.write_text('(kicad_symbol_lib\n  (symbol "R_100")\n)\n')
+        old = time.time_ns() - 10 * library._MTIME_GRANULARITY_NS
+        os.utime(sym_path, ns=(old, old))
+        library._load_symbol_index(str(sym_path))
+        assert str(sym_path) in library._symbol_index_cache
+
+    def test_same_tick_same_size_edit_is_seen(self, tmp_path, monkeypatch):
+        sym_path = tmp_path / "test.kicad_sym"
+        sym_path.write_text('(kicad_symbol_lib\n  (symbol "R_100")\n)\n')
+        # A filesystem whose stat cannot tell the two versions apart
+        frozen = os.stat(sym_path)
+        real_stat = os.stat
+        monkeypatch.setattr(
+            library.os, "stat", lambda p, *a, **k: frozen if p == str(sym_path) else real_stat(p, *a, **k)
+        )
+        assert library._load_symbol_index(str(sym_path)) == {"R_100"}
+        sym_path.write_text('(kicad_symbol_lib\n  (symbol "X_100")\n)\n')
+        assert library._load_symbol_index(str(sym_path)) == {"X_100"}
+
+
+class TestBinaryLibraryIO:
+    """Tests that library files are written byte-for-byte without newline translation."""
+
+    def test_symbol_library_uses_lf(self, tmp_path):
+        sym_path = tmp_path / "test.kicad_sym"
+        library.add_symbol_to_lib(str(sym_path), "R_100", '  (symbol "R_100")\n')
+        library.add_symbol_to_lib(str(sym_path), "C_100", '  (symbol "C_100")\n')
+        assert b"\r\n" not in sym_path.read_bytes()
+
+    def test_non_ascii_content_roundtrips(self, tmp_path):
+        sym_path = tmp_path / "test.kicad_sym"
+        library.add_symbol_to_lib(str(sym_path), "R_100", '  (symbol "R_100" (property "Value" "10µF"))\n')
+        library.add_symbol_to_lib(
+            str(sym_path), "R_100", '  (symbol "R_100" (property "Value" "22µF"))\n', overwrite=True
+        )
+        text = sym_path.read_text(encoding="utf-8")
+        assert "22µF" in text
+        assert "10µF" not in text
+
+    def test_footprint_written_verbatim(self, tmp_path):
+        library.save_footprint(str(tmp_path), "test", "(footprint µ)\n")
+        assert (tmp_path / "test.kicad_mod").read_bytes() == "(footprint µ)\n".encode()
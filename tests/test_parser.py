@@ -204,6 +204,14 @@ class TestParseFootprintShapes:
         assert fp.tracks[0].layer == "F.SilkS"
         assert len(fp.tracks[0].points) == 2
 
+    def test_parse_text_comma_separated_path(self):
+        """TEXT paths may separate coordinates with commas instead of spaces."""
+        shape = "TEXT~L~100~100~0.8~0~0~3~~4~+~M98,95L98,105M93,100L,103,100~~id1~~0~pinpart"
+        fp = parse_footprint_shapes([shape], 0, 0)
+        assert len(fp.tracks) == 2
+        assert fp.tracks[0].points == [(mil_to_mm(98), mil_to_mm(95)), (mil_to_mm(98), mil_to_mm(105))]
+        assert fp.tracks[1].points[1] == (mil_to_mm(103), mil_to_mm(100))
+
     def test_parse_text_stroke_width(self):
         """TEXT stroke width is converted from mils to mm."""
         shape = "TEXT~L~100~100~0.8~0~0~3~~4~+~M 98 95 L 98 105 M 93 100 L 103 100~~id1~~0~pinpart"
@@ -408,6 +416,19 @@ class TestComputeArcMidpoint:
         # Different large_arc flags should give different midpoints
         assert mid0 != mid1
 
+    def test_quarter_circle_all_flag_combinations(self):
+        # Unit-radius arcs from (1, 0) to (0, 1); centers at (0, 0) or (1, 1)
+        h = 0.5**0.5
+        expected = {
+            (0, 0): (1 - h, 1 - h),
+            (0, 1): (h, h),
+            (1, 0): (-h, -h),
+            (1, 1): (1 + h, 1 + h),
+        }
+        for (large_arc, sweep), (ex, ey) in expected.items():
+            mx, my = compute_arc_midpoint((1, 0), (0, 1), 1, 1, large_arc, sweep)
+            assert abs(mx - ex) < 1e-9 and abs(my - ey) < 1e-9, (large_arc, sweep)
+
 
 class TestParseSvgPolygon:
     """Test SVG polygon path parsing with different coordinate formats."""
@@ -18,6 +18,7 @@ from kicad_jlcimport.easyeda.parser import (
     _parse_sym_polyline,
     _parse_sym_rect,
     _parse_track,
+    _scan_pin_path,
     compute_arc_midpoint,
     mil_to_mm,
     parse_footprint_shapes,
@@ -129,6 +130,15 @@ class TestParsePad:
         pad = _parse_pad(parts)
         assert pad.layer == "2"  # B.Cu
 
+    def test_parse_pad_missing_trailing_fields(self):
+        parts = ["PAD", "RECT", "100", "200", "20", "10", "1"]
+        pad = _parse_pad(parts)
+        assert pad.number == ""
+        assert pad.drill == 0.0
+        assert pad.rotation == 0.0
+        assert pad.polygon_points == []
+        assert pad.slot_length == 0.0
+
 
 class TestParseTrack:
     """Tests for _parse_track function."""
@@ -210,6 +220,10 @@ class TestParseCircle:
         circle = _parse_circle(parts)
         assert circle is None  # Decorative circles are skipped
 
+    def test_skipped_layer_rejected_before_field_conversion(self):
+        parts = ["CIRCLE", "", "", "", "", "101"]
+        assert _parse_circle(parts) is None
+
     def test_filled_circle_when_stroke_covers_area(self):
         """Circle is filled when stroke width >= 2 * radius (stroke covers entire circle)."""
         # radius=50, width=100 -> width >= 2*radius -> filled
@@ -286,6 +300,14 @@ class TestParseSvgPolygon:
         points = _parse_svg_polygon("M abc def")
         assert len(points) == 0
 
+    def test_parse_polygon_skips_invalid_pair_only(self):
+        points = _parse_svg_polygon("M 0 0 L abc 5 L 10,20 Z")
+        assert points == [(0.0, 0.0), (mil_to_mm(10), mil_to_mm(20))]
+
+    def test_parse_polygon_uses_first_pair_per_command(self):
+        points = _parse_svg_polygon("M 0 0 99 L 10 20 A 1 1 0 0 1 5 5")
+        assert points == [(0.0, 0.0), (mil_to_mm(10), mil_to_mm(20))]
+
 
 class TestParseSvgnode:
     """Tests for _parse_svgnode function."""
@@ -329,6 +351,11 @@ class TestParseSvgnode:
         assert model.origin_y == 0
         assert model.z == 0
 
+    def test_parse_svgnode_json_containing_tilde(self):
+        json_str = json.dumps({"attrs": {"uuid": "abc123", "title": "R~0603"}})
+        fp = parse_footprint_shapes(["SVGNODE~" + json_str], 0, 0)
+        assert fp.model.uuid == "abc123"
+
 
 class TestParseRectAsTracks:
     """Tests for _parse_rect_as_tracks function."""
@@ -438,6 +465,22 @@ class TestParseSymArc:
         assert arc.sweep == 1  # flipped from SVG sweep=0
 
 
+class TestScanPinPath:
+    """Tests for _scan_pin_path function."""
+
+    def test_single_step_with_color_tail(self):
+        assert _scan_pin_path("M 380 240 h -20~#880000") == ((380.0, 240.0), "h", -20.0)
+
+    def test_compact_vertical_step(self):
+        assert _scan_pin_path("M400,300v10") == ((400.0, 300.0), "v", 10.0)
+
+    def test_horizontal_step_preferred_over_earlier_vertical(self):
+        assert _scan_pin_path("M 400 300 v 10 h 5") == ((400.0, 300.0), "h", 5.0)
+
+    def test_no_step(self):
+        assert _scan_pin_path("section1") == (None, None, 0.0)
+
+
 class TestParsePin:
     """Tests for _parse_pin function."""
 
@@ -541,10 +584,27 @@ class TestParseFootprintShapesExtended:
         expected_x = mil_to_mm(100) - mil_to_mm(50)
         assert abs(region.points[0][0] - expected_x) < 0.001
 
+    def test_last_svgnode_model_wins(self):
+        shapes = [f"SVGNODE~{json.dumps({'attrs': {'uuid': uuid}})}" for uuid in ("first", "second")]
+        fp = parse_footprint_shapes(shapes, 0, 0)
+        assert fp.model.uuid == "second"
+
+    def test_text_and_rect_tracks_keep_shape_order(self):
+        shapes = ["RECT~100~100~50~50~3~~~2", "TRACK~1~3~~0 0 10 10"]
+        fp = parse_footprint_shapes(shapes, 0, 0)
+        assert len(fp.tracks) == 2
+        assert len(fp.tracks[0].points) == 5
+        assert len(fp.tracks[1].points) == 2
+
 
 class TestParseSymbolShapesExtended:
     """Extended tests for parse_symbol_shapes."""
 
+    def test_unknown_and_unseparated_shapes_ignored(self):
+        sym = parse_symbol_shapes(["P", "X~1~2", "PIN~0~1~1~400~300"], 0, 0)
+        assert sym.pins == []
+        assert sym.polylines == []
+
     def test_parse_arc(self):
         shapes = ["A~0~0~M 100 100 A 50 50 0 0 1 150 150"]
         sym = parse_symbol_shapes(shapes, 0, 0)
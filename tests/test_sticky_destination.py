@@ -29,6 +29,48 @@ except ImportError:
     _has_textual = False
 
 
+@pytest.fixture(scope="module")
+def dialog_cls():
+    """The wx import dialog class, imported once per module."""
+    from kicad_jlcimport.dialog import JLCImportDialog
+
+    return JLCImportDialog
+
+
+@pytest.fixture(scope="module")
+def tui_cls():
+    """The Textual app class, imported once per module."""
+    from kicad_jlcimport.tui.app import JLCImportTUI
+
+    return JLCImportTUI
+
+
+@pytest.fixture(scope="module")
+def global_lib_dir(tmp_path_factory):
+    """A global library dir for the TUI tests; they only store the path, never write to it."""
+    return str(tmp_path_factory.mktemp("global_lib"))
+
+
+def _mock_config(monkeypatch, module):
+    """Replace a module's load_config/save_config with mocks."""
+    config = SimpleNamespace(load=MagicMock(return_value={}), save=MagicMock())
+    monkeypatch.setattr(module, "load_config", config.load)
+    monkeypatch.setattr(module, "save_config", config.save)
+    return config
+
+
+@pytest.fixture
+def dialog_config(monkeypatch, dialog_cls):
+    """Mocked config I/O for the dialog; tests set ``load.return_value``."""
+    return _mock_config(monkeypatch, sys.modules[dialog_cls.__module__])
+
+
+@pytest.fixture
+def tui_config(monkeypatch, tui_cls):
+    """Mocked config I/O for the TUI; tests set ``load.return_value``."""
+    return _mock_config(monkeypatch, sys.modules[tui_cls.__module__])
+
+
 class TestConfigUseGlobal:
     """Config layer: use_global key exists and round-trips through load/save."""
 
@@ -68,93 +110,54 @@ class TestConfigUseGlobal:
 class TestDialogStickyDestination:
     """wxPython dialog respects and saves use_global preference."""
 
-    def test_dialog_defaults_to_global_when_saved(self, monkeypatch):
-        """When config has use_global=True and project dir exists, Global is selected."""
-        monkeypatch.setattr(
-            "kicad_jlcimport.dialog.load_config",
-            lambda: {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": True},
-        )
-        from kicad_jlcimport.dialog import JLCImportDialog
-
-        dest_project = MagicMock()
-        dest_global = MagicMock()
-        dlg = SimpleNamespace(dest_project=dest_project, dest_global=dest_global)
-
-        JLCImportDialog._apply_saved_destination(dlg, "/some/project")
-
-        dest_global.SetValue.assert_called_with(True)
-
-    def test_dialog_defaults_to_project_when_saved_false(self, monkeypatch):
-        """When config has use_global=False and project dir exists, Project is selected."""
-        monkeypatch.setattr(
-            "kicad_jlcimport.dialog.load_config",
-            lambda: {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": False},
-        )
-        from kicad_jlcimport.dialog import JLCImportDialog
-
-        dest_project = MagicMock()
-        dest_global = MagicMock()
-        dlg = SimpleNamespace(dest_project=dest_project, dest_global=dest_global)
-
-        JLCImportDialog._apply_saved_destination(dlg, "/some/project")
-
-        dest_project.SetValue.assert_called_with(True)
-
-    def test_dialog_forces_global_when_no_project(self, monkeypatch):
-        """Even if use_global=False, Global is forced when no project dir."""
-        monkeypatch.setattr(
-            "kicad_jlcimport.dialog.load_config",
-            lambda: {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": False},
-        )
-        from kicad_jlcimport.dialog import JLCImportDialog
-
-        dest_project = MagicMock()
-        dest_global = MagicMock()
-        dlg = SimpleNamespace(dest_project=dest_project, dest_global=dest_global)
-
-        JLCImportDialog._apply_saved_destination(dlg, "")
-
-        dest_project.Disable.assert_called_once()
-        dest_global.SetValue.assert_called_with(True)
-
-    def test_dialog_saves_use_global_on_import(self, monkeypatch):
+    @pytest.mark.parametrize(
+        "use_global, project_dir, selected, project_disabled",
+        [
+            # Saved preference is honoured when a project dir exists
+            (True, "/some/project", "dest_global", False),
+            (False, "/some/project", "dest_project", False),
+            # Global is forced when there is no project dir
+            (False, "", "dest_global", True),
+        ],
+        ids=["saved-global", "saved-project", "no-project"],
+    )
+    def test_dialog_applies_saved_destination(
+        self, dialog_cls, dialog_config, use_global, project_dir, selected, project_disabled
+    ):
+        """The saved use_global picks the destination radio unless there is no project."""
+        dialog_config.load.return_value = {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": use_global}
+
+        dlg = SimpleNamespace(dest_project=MagicMock(), dest_global=MagicMock())
+
+        dialog_cls._apply_saved_destination(dlg, project_dir)
+
+        getattr(dlg, selected).SetValue.assert_called_with(True)
+        assert dlg.dest_project.Disable.called is project_disabled
+
+    def test_dialog_saves_use_global_on_import(self, dialog_cls, dialog_config):
         """_persist_destination saves use_global=True to config."""
-        saved = {}
-        monkeypatch.setattr(
-            "kicad_jlcimport.dialog.load_config",
-            lambda: {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": False},
-        )
-        monkeypatch.setattr("kicad_jlcimport.dialog.save_config", lambda c: saved.update(c))
-        from kicad_jlcimport.dialog import JLCImportDialog
+        dialog_config.load.return_value = {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": False}
 
         dlg = SimpleNamespace(dest_global=MagicMock())
         dlg.dest_global.GetValue.return_value = True
 
-        JLCImportDialog._persist_destination(dlg)
+        dialog_cls._persist_destination(dlg)
 
-        assert saved["use_global"] is True
+        assert dialog_config.save.call_args.args[0]["use_global"] is True
 
-    def test_dialog_saves_use_global_false_on_project_import(self, monkeypatch):
+    def test_dialog_saves_use_global_false_on_project_import(self, dialog_cls, dialog_config):
         """Importing to project persists use_global=False."""
-        saved = {}
-        monkeypatch.setattr(
-            "kicad_jlcimport.dialog.load_config",
-            lambda: {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": True},
-        )
-        monkeypatch.setattr("kicad_jlcimport.dialog.save_config", lambda c: saved.update(c))
-        from kicad_jlcimport.dialog import JLCImportDialog
+        dialog_config.load.return_value = {"lib_name": "JLCImport", "global_lib_dir": "", "use_global": True}
 
         dlg = SimpleNamespace(dest_global=MagicMock())
         dlg.dest_global.GetValue.return_value = False
 
-        JLCImportDialog._persist_destination(dlg)
+        dialog_cls._persist_destination(dlg)
 
-        assert saved["use_global"] is False
+        assert dialog_config.save.call_args.args[0]["use_global"] is False
 
-    def test_dialog_does_not_persist_on_import_failure(self, monkeypatch):
+    def test_dialog_does_not_persist_on_import_failure(self, dialog_cls):
         """A failed import should not persist the destination preference."""
-        from kicad_jlcimport.dialog import JLCImportDialog
-
         dlg = SimpleNamespace(
             _busy_overlay=MagicMock(),
             _main_panel=MagicMock(),
@@ -162,7 +165,7 @@ class TestDialogStickyDestination:
             _persist_destination=MagicMock(),
         )
 
-        JLCImportDialog._on_import_error(dlg, "import failed")
+        dialog_cls._on_import_error(dlg, "import failed")
 
         dlg._persist_destination.assert_not_called()
 
@@ -171,119 +174,54 @@ class TestDialogStickyDestination:
 class TestTUIStickyDestination:
     """Textual TUI respects and saves use_global preference."""
 
-    def test_tui_constructor_stores_use_global_from_config(self, tmp_path, monkeypatch):
-        """TUI app reads use_global from config on construction."""
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.load_config",
-            lambda: {"lib_name": "JLCImport", "use_global": True},
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.get_global_lib_dir",
-            lambda _v: str(tmp_path),
-        )
-        from kicad_jlcimport.tui.app import JLCImportTUI
-
-        app = JLCImportTUI()
-        assert app._use_global is True
-
-    def test_tui_constructor_defaults_use_global_false(self, tmp_path, monkeypatch):
-        """TUI app defaults use_global to False when not in config."""
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.load_config",
-            lambda: {"lib_name": "JLCImport"},
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.get_global_lib_dir",
-            lambda _v: str(tmp_path),
-        )
-        from kicad_jlcimport.tui.app import JLCImportTUI
-
-        app = JLCImportTUI()
-        assert app._use_global is False
-
-    def test_tui_compose_uses_saved_global_preference(self, tmp_path, monkeypatch):
-        """When use_global=True in config and project dir available, global radio is selected."""
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.load_config",
-            lambda: {"lib_name": "JLCImport", "use_global": True},
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.get_global_lib_dir",
-            lambda _v: str(tmp_path),
-        )
-        from kicad_jlcimport.tui.app import JLCImportTUI
-
-        app = JLCImportTUI(project_dir="/some/project")
-        # _use_global should be True, meaning global radio should be initially selected
-        assert app._use_global is True
-
-    def test_tui_forces_global_when_no_project_dir(self, tmp_path, monkeypatch):
-        """Even if use_global=False in config, global is selected when no project dir."""
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.load_config",
-            lambda: {"lib_name": "JLCImport", "use_global": False},
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.get_global_lib_dir",
-            lambda _v: str(tmp_path),
-        )
-        from kicad_jlcimport.tui.app import JLCImportTUI
-
-        app = JLCImportTUI()  # no project_dir
-        # _use_global is False but _select_global in compose() should be True
-        # because self._project_dir is empty
-        assert app._use_global is False
-        assert not app._project_dir
-
-    def test_tui_persist_destination_saves_use_global(self, tmp_path, monkeypatch):
+    @pytest.fixture(autouse=True)
+    def _global_lib_dir(self, monkeypatch, tui_cls, global_lib_dir):
+        """Resolve the global library dir to the shared directory in every test."""
+        monkeypatch.setattr(sys.modules[tui_cls.__module__], "get_global_lib_dir", lambda _v: global_lib_dir)
+
+    @pytest.mark.parametrize(
+        "config, project_dir, use_global",
+        [
+            ({"lib_name": "JLCImport", "use_global": True}, "", True),
+            ({"lib_name": "JLCImport"}, "", False),
+            ({"lib_name": "JLCImport", "use_global": True}, "/some/project", True),
+            # compose() still selects global, because there is no project dir
+            ({"lib_name": "JLCImport", "use_global": False}, "", False),
+        ],
+        ids=["saved-global", "missing-key", "saved-global-with-project", "no-project"],
+    )
+    def test_tui_constructor_reads_use_global(self, tui_cls, tui_config, config, project_dir, use_global):
+        """TUI app reads use_global from config on construction, defaulting to False."""
+        tui_config.load.return_value = config
+
+        app = tui_cls(project_dir=project_dir)
+        assert app._use_global is use_global
+        assert app._project_dir == project_dir
+
+    def test_tui_persist_destination_saves_use_global(self, tui_cls, tui_config):
         """_persist_destination saves use_global to config."""
-        saved = {}
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.load_config",
-            lambda: {"lib_name": "JLCImport", "use_global": False},
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.save_config",
-            lambda c: saved.update(c),
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.get_global_lib_dir",
-            lambda _v: str(tmp_path),
-        )
-        from kicad_jlcimport.tui.app import JLCImportTUI
+        tui_config.load.return_value = {"lib_name": "JLCImport", "use_global": False}
 
-        app = JLCImportTUI()
-        JLCImportTUI._persist_destination(app, use_global=True)
+        app = tui_cls()
+        tui_cls._persist_destination(app, use_global=True)
 
-        assert saved["use_global"] is True
+        assert tui_config.save.call_args.args[0]["use_global"] is True
 
-    def test_tui_does_not_persist_on_import_failure(self, tmp_path, monkeypatch):
+    def test_tui_does_not_persist_on_import_failure(self, tmp_path, monkeypatch, tui_cls, tui_config):
         """A failed import should not persist the destination preference."""
-        saved = {}
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.load_config",
-            lambda: {"lib_name": "JLCImport", "use_global": False},
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.save_config",
-            lambda c: saved.update(c),
-        )
-        monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.get_global_lib_dir",
-            lambda _v: str(tmp_path),
-        )
+        tui_config.load.return_value = {"lib_name": "JLCImport", "use_global": False}
         monkeypatch.setattr(
-            "kicad_jlcimport.tui.app.import_component",
+            sys.modules[tui_cls.__module__],
+            "import_component",
             MagicMock(side_effect=Exception("import failed")),
         )
-        from kicad_jlcimport.tui.app import JLCImportTUI
 
-        app = JLCImportTUI()
+        app = tui_cls()
 
         # _do_import should raise, so _persist_destination should not be reached
         try:
-            JLCImportTUI._do_import(app, "C427602", str(tmp_path), True, 9)
+            tui_cls._do_import(app, "C427602", str(tmp_path), True, 9)
         except Exception:
             pass
 
-        assert "use_global" not in saved
+        tui_config.save.assert_not_called()
@@ -2,6 +2,8 @@
 
 import re
 
+import pytest
+
 from kicad_jlcimport.easyeda.ee_types import EECircle, EEPin, EEPolyline, EERectangle, EESymbol
 from kicad_jlcimport.kicad.symbol_writer import (
     _estimate_bottom,
@@ -13,42 +15,37 @@ from kicad_jlcimport.kicad.symbol_writer import (
 from kicad_jlcimport.kicad.version import KICAD_V8, KICAD_V9
 
 
-def _make_symbol(**kwargs):
-    """Create an EESymbol with optional components."""
-    sym = EESymbol()
-    if "pins" in kwargs:
-        sym.pins = kwargs["pins"]
-    if "rectangles" in kwargs:
-        sym.rectangles = kwargs["rectangles"]
-    if "circles" in kwargs:
-        sym.circles = kwargs["circles"]
-    if "polylines" in kwargs:
-        sym.polylines = kwargs["polylines"]
-    return sym
+def _assert_all_in(text: str, needles) -> None:
+    """Assert that every needle occurs in text, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing from output: {missing}"
+
+
+@pytest.fixture(scope="module")
+def empty_symbol_output():
+    """write_symbol output for an empty symbol with default options."""
+    return write_symbol(EESymbol(), "Test")
 
 
 class TestWriteSymbol:
-    def test_minimal_symbol(self):
-        sym = _make_symbol()
-        result = write_symbol(sym, "Test")
-        assert '(symbol "Test"' in result
-        assert "(in_bom yes)" in result
-        assert "(on_board yes)" in result
+    def test_minimal_symbol(self, empty_symbol_output):
+        result = empty_symbol_output
+        _assert_all_in(result, ['(symbol "Test"', "(in_bom yes)", "(on_board yes)"])
 
     def test_reference_property(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", prefix="R")
         assert '(property "Reference" "R"' in result
 
     def test_value_property(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "My_Resistor")
         assert '(property "Value" "My_Resistor"' in result
 
     def test_reference_positioned_above_symbol(self):
         """Reference property must be positioned above the symbol body, not inside it."""
         rect = EERectangle(x=-5, y=5, width=10, height=-10)  # top=5, bottom=-5
-        sym = _make_symbol(rectangles=[rect])
+        sym = EESymbol(rectangles=[rect])
         result = write_symbol(sym, "Test", prefix="U")
 
         # Extract Reference Y position
@@ -62,7 +59,7 @@ class TestWriteSymbol:
     def test_value_positioned_below_symbol(self):
         """Value property must be positioned below the symbol body, not inside it."""
         rect = EERectangle(x=-5, y=5, width=10, height=-10)  # top=5, bottom=-5
-        sym = _make_symbol(rectangles=[rect])
+        sym = EESymbol(rectangles=[rect])
         result = write_symbol(sym, "TestValue", prefix="U")
 
         # Extract Value Y position
@@ -74,13 +71,13 @@ class TestWriteSymbol:
         assert val_y < -5, f"Value Y={val_y} should be below symbol bottom (-5)"
 
     def test_footprint_property(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", footprint_ref="JLCImport:Test")
         assert '(property "Footprint" "JLCImport:Test"' in result
 
     def test_metadata_properties_are_hidden(self):
         """Footprint, Datasheet, LCSC properties must have 'hide' to avoid schematic clutter."""
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", footprint_ref="JLC:Test", datasheet="https://x.com", lcsc_id="C1")
         for prop_name in ["Footprint", "Datasheet", "LCSC"]:
             # Find the property block (property line + effects line)
@@ -92,7 +89,7 @@ class TestWriteSymbol:
                     break
 
     def test_ki_keywords_property(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", keywords="C123 MPN SOT-23")
         assert '(property "ki_keywords" "C123 MPN SOT-23"' in result
         # ki_keywords must be hidden
@@ -102,93 +99,78 @@ class TestWriteSymbol:
                 assert "hide" in lines[i + 1]
                 break
 
-    def test_ki_keywords_omitted_when_empty(self):
-        sym = _make_symbol()
-        result = write_symbol(sym, "Test")
-        assert "ki_keywords" not in result
+    def test_ki_keywords_omitted_when_empty(self, empty_symbol_output):
+        assert "ki_keywords" not in empty_symbol_output
 
     def test_lcsc_property(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", lcsc_id="C123456")
         assert '(property "LCSC" "C123456"' in result
 
     def test_datasheet_property(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", datasheet="https://example.com/ds.pdf")
         assert '(property "Datasheet" "https://example.com/ds.pdf"' in result
 
     def test_manufacturer_properties(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", manufacturer="Acme Corp", manufacturer_part="ACM-001")
-        assert '(property "Manufacturer" "Acme Corp"' in result
-        assert '(property "Manufacturer Part" "ACM-001"' in result
+        _assert_all_in(result, ['(property "Manufacturer" "Acme Corp"', '(property "Manufacturer Part" "ACM-001"'])
 
     def test_pin_generation(self):
         pin = EEPin(number="1", name="VCC", x=0, y=0, rotation=0, length=2.54, electrical_type="power_in")
-        sym = _make_symbol(pins=[pin])
+        sym = EESymbol(pins=[pin])
         result = write_symbol(sym, "Test")
-        assert "(pin power_in line" in result
-        assert '(name "VCC"' in result
-        assert '(number "1"' in result
+        _assert_all_in(result, ["(pin power_in line", '(name "VCC"', '(number "1"'])
 
     def test_pin_hidden_name(self):
         pin = EEPin(
             number="1", name="VCC", x=0, y=0, rotation=0, length=2.54, electrical_type="power_in", name_visible=False
         )
-        sym = _make_symbol(pins=[pin])
+        sym = EESymbol(pins=[pin])
         result = write_symbol(sym, "Test")
-        assert "(name" in result
-        # The hide should be in the name effects
-        name_line = [line for line in result.split("\n") if '(name "VCC"' in line][0]
-        assert "hide" in name_line
+        # The hide should be in the name effects, on the same line
+        assert re.search(r'\(name "VCC"[^\n]*hide', result)
 
     def test_pin_hidden_number(self):
         pin = EEPin(
             number="1", name="X", x=0, y=0, rotation=0, length=2.54, electrical_type="input", number_visible=False
         )
-        sym = _make_symbol(pins=[pin])
+        sym = EESymbol(pins=[pin])
         result = write_symbol(sym, "Test")
-        num_line = [line for line in result.split("\n") if '(number "1"' in line][0]
-        assert "hide" in num_line
+        assert re.search(r'\(number "1"[^\n]*hide', result)
 
     def test_rectangle_generation(self):
         rect = EERectangle(x=-5, y=5, width=10, height=-10)
-        sym = _make_symbol(rectangles=[rect])
+        sym = EESymbol(rectangles=[rect])
         result = write_symbol(sym, "Test")
-        assert "(rectangle" in result
-        assert "(start" in result
-        assert "(end" in result
-        assert "(fill (type background))" in result
+        _assert_all_in(result, ["(rectangle", "(start", "(end", "(fill (type background))"])
 
     def test_circle_generation(self):
         circle = EECircle(cx=0, cy=0, radius=3.0, width=0.254, layer="")
-        sym = _make_symbol(circles=[circle])
+        sym = EESymbol(circles=[circle])
         result = write_symbol(sym, "Test")
-        assert "(circle" in result
-        assert "(center" in result
-        assert "(radius" in result
+        _assert_all_in(result, ["(circle", "(center", "(radius"])
 
     def test_polyline_generation(self):
         poly = EEPolyline(points=[(0, 0), (1, 1), (2, 0)], closed=False, fill=False)
-        sym = _make_symbol(polylines=[poly])
+        sym = EESymbol(polylines=[poly])
         result = write_symbol(sym, "Test")
-        assert "(polyline" in result
-        assert "(pts" in result
-        assert "(fill (type none))" in result
+        _assert_all_in(result, ["(polyline", "(pts", "(fill (type none))"])
 
     def test_polygon_filled(self):
         poly = EEPolyline(points=[(0, 0), (1, 1), (2, 0)], closed=True, fill=True)
-        sym = _make_symbol(polylines=[poly])
+        sym = EESymbol(polylines=[poly])
         result = write_symbol(sym, "Test")
         assert "(fill (type outline))" in result
 
     def test_special_chars_escaped(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "Test", description='Has "quotes" and\nnewlines')
         assert '\\"quotes\\"' in result
 
     def test_unit_sub_symbol_naming(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         result = write_symbol(sym, "MyPart")
         # Single unit: uses _0_1
         assert '(symbol "MyPart_0_1"' in result
@@ -200,7 +182,7 @@ class TestWriteSymbol:
         last corner arc and the first corner arc.
         """
         rect = EERectangle(x=-5, y=5, width=10, height=-10, corner_radius=1.0)
-        sym = _make_symbol(rectangles=[rect])
+        sym = EESymbol(rectangles=[rect])
         result = write_symbol(sym, "Test")
         # Should NOT produce a native (rectangle ...) block
         assert "(rectangle" not in result
@@ -236,24 +218,22 @@ class TestRoundedRectPoints:
 
 class TestEstimateTopBottom:
     def test_top_from_rectangles(self):
-        sym = _make_symbol(rectangles=[EERectangle(x=0, y=5, width=10, height=-10)])
+        sym = EESymbol(rectangles=[EERectangle(x=0, y=5, width=10, height=-10)])
         top = _estimate_top(sym)
         assert top == 5  # max of y and y+height
 
     def test_bottom_from_rectangles(self):
-        sym = _make_symbol(rectangles=[EERectangle(x=0, y=5, width=10, height=-10)])
+        sym = EESymbol(rectangles=[EERectangle(x=0, y=5, width=10, height=-10)])
         bottom = _estimate_bottom(sym)
         assert bottom == -5  # min of y and y+height
 
     def test_top_from_pins(self):
-        sym = _make_symbol(
-            pins=[EEPin(number="1", name="A", x=0, y=10, rotation=0, length=2.54, electrical_type="input")]
-        )
+        sym = EESymbol(pins=[EEPin(number="1", name="A", x=0, y=10, rotation=0, length=2.54, electrical_type="input")])
         top = _estimate_top(sym)
         assert top == 10
 
     def test_defaults_when_empty(self):
-        sym = _make_symbol()
+        sym = EESymbol()
         assert _estimate_top(sym) == 5.0
         assert _estimate_bottom(sym) == -5.0
 
@@ -261,8 +241,7 @@ class TestEstimateTopBottom:
 class TestWriteSymbolLibraryVersions:
     def test_v9_library_has_generator_version(self):
         result = write_symbol_library([], kicad_version=KICAD_V9)
-        assert "(version 20241209)" in result
-        assert '(generator_version "1.0")' in result
+        _assert_all_in(result, ["(version 20241209)", '(generator_version "1.0")'])
 
     def test_v8_library_no_generator_version(self):
         result = write_symbol_library([], kicad_version=KICAD_V8)
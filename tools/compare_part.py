@@ -28,12 +28,11 @@ from kicad_jlcimport.kicad.symbol_writer import write_symbol, write_symbol_libra
 KICAD_CLI = shutil.which("kicad-cli") or "/Applications/KiCad/KiCad.app/Contents/MacOS/kicad-cli"
 
 
-def fetch_easyeda_svgs(lcsc_id: str) -> dict:
-    """Fetch EasyEDA preview SVGs for a part.
+def fetch_easyeda_svgs(uuids: list) -> dict:
+    """Extract EasyEDA preview SVGs from a ``fetch_component_uuids`` result.
 
     Returns dict with 'symbol_svg' and 'footprint_svg' strings (or None).
     """
-    uuids = fetch_component_uuids(lcsc_id)
     symbol_svg = None
     footprint_svg = None
     for entry in uuids:
@@ -520,8 +519,11 @@ def compare_part(lcsc_id: str, tmp_dir: str, verbose: bool = False) -> dict:
     # Fetch EasyEDA preview SVGs
     if verbose:
         print("  Fetching EasyEDA SVGs...")
+    # The same lookup also feeds fetch_full_component, so do it only once.
+    uuids = None
     try:
-        easyeda_svgs = fetch_easyeda_svgs(lcsc_id)
+        uuids = fetch_component_uuids(lcsc_id)
+        easyeda_svgs = fetch_easyeda_svgs(uuids)
     except Exception as e:
         if verbose:
             print(f"  Error fetching EasyEDA SVGs: {e}")
@@ -531,7 +533,7 @@ def compare_part(lcsc_id: str, tmp_dir: str, verbose: bool = False) -> dict:
     if verbose:
         print("  Fetching component data...")
     try:
-        comp = fetch_full_component(lcsc_id)
+        comp = fetch_full_component(lcsc_id, uuids=uuids)
     except Exception as e:
         if verbose:
             print(f"  Error fetching component: {e}")